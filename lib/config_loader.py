@@ -2,10 +2,16 @@ import json
 
 CONFIG_PATH = "/config.json"
 
+_config = None  # Parsed once per boot, shared by all importers
+
 def load_config():
+    global _config
+    if _config is not None:
+        return _config
     try:
         with open(CONFIG_PATH) as f:
-            return json.load(f)
+            _config = json.load(f)
     except Exception as e:
         print(f"[Config] Failed to load: {e}")
-        return {}
\ No newline at end of file
+        return {}
+    return _config
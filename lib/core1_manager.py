@@ -1,8 +1,10 @@
-from machine import ADC, Pin, I2C, Timer
+from machine import ADC, Pin, I2C, Timer, mem32
+import _thread
 from mpu6050_minimal import MPU6050
-from shared_state import push_sensor_data
-import utime, math, micropython
-import random
+from shared_state import push_sensor_data, push_sensor_data_batch
+import utime, math, micropython, sys
+from micropython import const
+from array import array
 from time import ticks_ms, ticks_diff
 import logger
 from config_loader import load_config
@@ -11,30 +13,69 @@ config = load_config()
 
 micropython.alloc_emergency_exception_buf(100)
 
-# --- Timers ---
-mic_timer = None
-mpu_timer = None
-mpu_temp_timer = None
-door_timer = None
-power_timer = None
+# --- Timer ---
+sensor_timer = None   # Single dispatcher timer for all Core 1 sensors
+_sensor_cbs = ()      # Phase table: one callback per timer tick
+_phase = 0
+
+_stop_lock = _thread.allocate_lock()  # Held while Core 1 runs; stop_core1() releases it
+_stop_lock.acquire()                  # Taken before any thread starts: no park/stop race
+_stopping = False                     # Set by stop_core1(); cleared when core1_main exits
 
 # --- MIC Setup ---
 AUDIO_PIN = 26
 SAMPLE_COUNT = 512
-SAMPLE_DELAY_US = 50  # ~20 kHz sampling
+SAMPLE_DELAY_US = const(50)  # ~20 kHz sampling; const so viper inlines it
 DB_REF = 0.707        # Reference voltage for dB scaling
 PTP_THRESHOLD = 0.05  # Minimum peak-to-peak voltage to flag activity
 
-adc = ADC(Pin(AUDIO_PIN))
-conv = 3.3 / 65535
-
+mic_adc = ADC(Pin(AUDIO_PIN))
+
+_mic_stats_out = array('i', bytearray(20))  # sum, min, max, sumsq_hi, sumsq_lo
+conv12 = 3.3 / 4095  # Volts per native 12-bit ADC count
+
+@micropython.viper
+def _mic_stats(buf: ptr16, n: int, out: ptr32):
+    # One native pass over the 12-bit samples. v*v fits a machine word;
+    # the square sum carries into a high word.
+    total = 0
+    sq_hi = 0
+    sq_lo = 0
+    lo = 0xFFF
+    hi = 0
+    i = 0
+    while i < n:
+        v = int(buf[i])
+        total += v
+        sq_lo += v * v
+        if sq_lo >= 0x1000000:
+            sq_hi += sq_lo >> 24
+            sq_lo &= 0xFFFFFF
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+        i += 1
+    out[0] = total
+    out[1] = lo
+    out[2] = hi
+    out[3] = sq_hi
+    out[4] = sq_lo
+
+@micropython.native
 def compute_metrics(samples):
-    mean = sum(samples) / len(samples)
-    centered = [(v - mean) for v in samples]
-
-    rms = math.sqrt(sum(v**2 for v in centered) / len(centered))
+    # samples holds raw ADC counts; scale to volts only on the results
+    n = len(samples)
+    out = _mic_stats_out
+    _mic_stats(samples, n, out)
+    total = out[0]
+    sumsq = (out[3] << 24) + out[4]
+
+    # n²·variance = n·Σv² − (Σv)², exact in integers before scaling
+    rms = math.sqrt((n * sumsq - total * total) / (n * n)) * conv12
     db = 20 * math.log10(rms / DB_REF) if rms > 0 else -float('inf')
-    ptp = max(samples) - min(samples)
+    ptp = (out[2] - out[1]) * conv12
+    mean = total / n * conv12
 
     return {
         'rms': rms,
@@ -43,24 +84,105 @@ def compute_metrics(samples):
         'mean': mean
     }
 
-def mic_cb_stub(timer):
-    micropython.schedule(mic_cb_scheduled, 0)
+_mic_samples = array('H', bytearray(2 * SAMPLE_COUNT))  # 12-bit ADC counts
+
+_TICKS_MASK = const(0x3FFFFFFF)  # ticks_us() wraps at 2**30 on rp2
+_TICKS_HALF = const(0x20000000)
+
+_mic_read = mic_adc.read_u16  # Bound once; viper kernels take at most 4 args
+
+@micropython.viper
+def _mic_acquire(buf: ptr16, n: int):
+    # Polling fallback: stores unboxed 12-bit readings straight into the buffer.
+    # Paced against a running deadline, so the loop's own overhead counts
+    # toward the period and we only sleep the residual (if any).
+    read = _mic_read
+    ticks_us = utime.ticks_us
+    sleep_us = utime.sleep_us
+    period_us = SAMPLE_DELAY_US
+    deadline = int(ticks_us())
+    i = 0
+    while i < n:
+        buf[i] = int(read()) >> 4
+        deadline = (deadline + period_us) & _TICKS_MASK
+        rem = ((deadline - int(ticks_us()) + _TICKS_HALF) & _TICKS_MASK) - _TICKS_HALF  # ticks_diff
+        if rem > 0:
+            sleep_us(rem)
+        i += 1
+
+# --- MIC DMA capture ---
+# The ADC free-runs at the sample rate and DMA copies its FIFO into
+# _mic_samples, so acquisition costs no CPU. Register layout is shared by
+# RP2040 and RP2350; only the base address and DREQ number differ.
+if "RP2350" in sys.implementation._machine:
+    _ADC_BASE, _DREQ_ADC = 0x400A0000, 48
+else:
+    _ADC_BASE, _DREQ_ADC = 0x4004C000, 36
+_ADC_CS = _ADC_BASE + 0x00
+_ADC_FCS = _ADC_BASE + 0x08
+_ADC_FIFO = _ADC_BASE + 0x0C
+_ADC_DIV = _ADC_BASE + 0x10
+_ADC_CLK_HZ = 48_000_000
+MIC_ADC_CHANNEL = AUDIO_PIN - 26
+MIC_DMA_TIMEOUT_MS = 100
+
+try:
+    import rp2
+    _mic_dma = rp2.DMA()
+    _mic_dma_ctrl = _mic_dma.pack_ctrl(size=1, inc_read=False, inc_write=True, treq_sel=_DREQ_ADC)
+except Exception as e:
+    _mic_dma = None  # Older firmware without rp2.DMA — use the polling loop
+    logger.warn(f"MIC: DMA unavailable, polling ADC ({e})")
+
+def _adc_drain_fifo():
+    while not (mem32[_ADC_FCS] & 0x100):  # FCS.EMPTY
+        mem32[_ADC_FIFO]
+
+def _mic_dma_capture(buf, n):
+    # Select the mic channel and pace conversions with the clock divider
+    cs = mem32[_ADC_CS] & ~((0xF << 12) | 0x8)
+    mem32[_ADC_CS] = cs | (MIC_ADC_CHANNEL << 12) | 0x1
+    mem32[_ADC_DIV] = (_ADC_CLK_HZ * SAMPLE_DELAY_US // 1_000_000 - 1) << 8
+    mem32[_ADC_FCS] = (1 << 24) | 0x8 | 0x1  # THRESH=1, DREQ_EN, EN
+    _adc_drain_fifo()
+
+    _mic_dma.config(read=_ADC_FIFO, write=buf, count=n, ctrl=_mic_dma_ctrl, trigger=True)
+    mem32[_ADC_CS] = mem32[_ADC_CS] | 0x8  # START_MANY
+    try:
+        start = ticks_ms()
+        while _mic_dma.active():
+            if ticks_diff(ticks_ms(), start) > MIC_DMA_TIMEOUT_MS:
+                _mic_dma.active(0)
+                raise OSError("MIC DMA timeout")
+            utime.sleep_ms(2)
+    finally:
+        # Hand the ADC back to one-shot mode for machine.ADC reads
+        mem32[_ADC_CS] = mem32[_ADC_CS] & ~0x8
+        while not (mem32[_ADC_CS] & 0x100):  # CS.READY
+            pass
+        mem32[_ADC_FCS] = 0
+        mem32[_ADC_DIV] = 0
+        _adc_drain_fifo()
+
+# Reused telemetry payloads: push_sensor_data*() copies on publish, so the
+# callbacks can mutate these in place instead of building a dict per tick
+_MIC_MSG = {'sensor': 'mic', 'disp_data': None, 'rms': None, 'db': None, 'P2P': None}
 
 def mic_cb_scheduled(_):
     try:
-        samples = []
-        for _ in range(SAMPLE_COUNT):
-            samples.append(adc.read_u16() * conv)
-            utime.sleep_us(SAMPLE_DELAY_US)  # ~20kHz sampling
+        samples = _mic_samples
+        if _mic_dma:
+            _mic_dma_capture(samples, SAMPLE_COUNT)
+        else:
+            _mic_acquire(samples, SAMPLE_COUNT)  # ~20kHz sampling
 
         metrics = compute_metrics(samples)
-        push_sensor_data({
-            'sensor': 'mic',
-            'disp_data':metrics['db'],
-            'rms': metrics['rms'],
-            'db': metrics['db'],
-            'P2P': metrics['ptp']
-        })
+        msg = _MIC_MSG
+        msg['disp_data'] = metrics['db']
+        msg['rms'] = metrics['rms']
+        msg['db'] = metrics['db']
+        msg['P2P'] = metrics['ptp']
+        push_sensor_data(msg)
     except Exception as e:
         push_sensor_data({'sensor': 'mic', 'error': str(e)})
 
@@ -72,25 +194,93 @@ except Exception as e:
     mpu = None
     push_sensor_data({'sensor': 'mpu', 'error': f'Init failed: {e}'})
 
-def mpu_cb_stub(timer):
-    micropython.schedule(mpu_cb_scheduled, 0)
+MPU_SAMPLE_COUNT = const(128)  # const: the viper kernels below inline it
+ACCEL_LSB_PER_G = 16384.0
+# Structure-of-arrays raw int16 sample buffers, reused every tick
+_ax = array('h', bytearray(2 * MPU_SAMPLE_COUNT))
+_ay = array('h', bytearray(2 * MPU_SAMPLE_COUNT))
+_az = array('h', bytearray(2 * MPU_SAMPLE_COUNT))
+_mpu_stats_out = array('i', bytearray(16))  # sumsq_hi, sumsq_lo, z_min, z_max
+_mpu_fifo = bytearray(6 * MPU_SAMPLE_COUNT)   # 128 accel frames from the MPU FIFO
+MPU_FIFO_TIMEOUT_MS = 300
+
+@micropython.viper
+def _mpu_unpack(src: ptr8, ax: ptr16, ay: ptr16, az: ptr16):
+    # Split MPU_SAMPLE_COUNT big-endian XYZ frames into the SoA buffers
+    i = 0
+    j = 0
+    while i < MPU_SAMPLE_COUNT:
+        ax[i] = (src[j] << 8) | src[j + 1]
+        ay[i] = (src[j + 2] << 8) | src[j + 3]
+        az[i] = (src[j + 4] << 8) | src[j + 5]
+        j += 6
+        i += 1
+
+@micropython.viper
+def _mpu_stats(ax: ptr16, ay: ptr16, az: ptr16, out: ptr32):
+    # Single pass over raw counts: sum of squared magnitudes + Z extremes.
+    # Axes are halved so x²+y²+z² fits a machine word; the square sum
+    # carries into a high word.
+    sq_hi = 0
+    sq_lo = 0
+    z_min = 32767
+    z_max = -32768
+    i = 0
+    while i < MPU_SAMPLE_COUNT:
+        x = int(ax[i])
+        y = int(ay[i])
+        z = int(az[i])
+        if x > 32767:
+            x -= 65536
+        if y > 32767:
+            y -= 65536
+        if z > 32767:
+            z -= 65536
+        if z < z_min:
+            z_min = z
+        if z > z_max:
+            z_max = z
+        x >>= 1
+        y >>= 1
+        z >>= 1
+        sq_lo += x*x + y*y + z*z
+        if sq_lo >= 0x1000000:
+            sq_hi += sq_lo >> 24
+            sq_lo &= 0xFFFFFF
+        i += 1
+    out[0] = sq_hi
+    out[1] = sq_lo
+    out[2] = z_min
+    out[3] = z_max
 
 def mpu_cb_scheduled(_):
     if not mpu: return
     try:
-        accel_samples = []
-        for _ in range(128):
-            accel_samples.append(mpu.get_accel())
-            utime.sleep_ms(1)
+        # Let the MPU collect 128 samples at 1 kHz, then drain them in one burst
+        ax, ay, az = _ax, _ay, _az
+        fifo = _mpu_fifo
+        need = len(fifo)
+        mpu.start_accel_fifo()
+        try:
+            start = ticks_ms()
+            while mpu.fifo_count() < need:
+                if ticks_diff(ticks_ms(), start) > MPU_FIFO_TIMEOUT_MS:
+                    raise OSError("MPU FIFO timeout")
+                utime.sleep_ms(10)
+            mpu.read_fifo_into(fifo)
+        finally:
+            mpu.stop_fifo()  # Also on I2C errors, or the FIFO overflows into the next tick
+        _mpu_unpack(fifo, ax, ay, az)
+
+        out = _mpu_stats_out
+        _mpu_stats(ax, ay, az, out)
+        sumsq = ((out[0] << 24) + out[1]) * 4  # Undo the per-axis halving
 
         # RMS magnitude
-        rms_mag = math.sqrt(sum(
-            a['x']**2 + a['y']**2 + a['z']**2 for a in accel_samples
-        ) / len(accel_samples))
+        rms_mag = math.sqrt(sumsq / MPU_SAMPLE_COUNT) / ACCEL_LSB_PER_G
 
         # Peak-to-peak Z
-        z_vals = [a['z'] for a in accel_samples]
-        peak_z = max(z_vals) - min(z_vals)
+        peak_z = (out[3] - out[2]) / ACCEL_LSB_PER_G
 
         # Vibration Index
         vib_index = rms_mag * peak_z
@@ -103,54 +293,26 @@ def mpu_cb_scheduled(_):
             'peak_z': peak_z
         })
         '''
-        push_sensor_data({
-            'sensor': 'accel_x',
-            'disp_data': mpu.get_accel()['x']
-        })
-        push_sensor_data({
-            'sensor': 'accel_y',
-            'disp_data': mpu.get_accel()['y']
-        })
-        push_sensor_data({
-            'sensor': 'accel_z',
-            'disp_data': mpu.get_accel()['z']
-        })
-        push_sensor_data({
-            'sensor': 'gyro_x',
-            'disp_data': mpu.get_gyro()['x']
-        })
-        push_sensor_data({
-            'sensor': 'gyro_y',
-            'disp_data': mpu.get_gyro()['y']
-        })
-        push_sensor_data({
-            'sensor': 'gyro_z',
-            'disp_data': mpu.get_gyro()['z']
-        })
-        
+        ax, ay, az, _, gx, gy, gz = mpu.read_all()
+        push_sensor_data_batch((
+            {'sensor': 'accel_x', 'disp_data': ax},
+            {'sensor': 'accel_y', 'disp_data': ay},
+            {'sensor': 'accel_z', 'disp_data': az},
+            {'sensor': 'gyro_x', 'disp_data': gx},
+            {'sensor': 'gyro_y', 'disp_data': gy},
+            {'sensor': 'gyro_z', 'disp_data': gz},
+        ))
+
     except Exception as e:
         push_sensor_data({'sensor': 'mpu', 'error': str(e)})
 
 # --- MPU6050 Temperature Setup ---
-def mpu_temp_cb_stub(timer):
-    micropython.schedule(mpu_temp_cb_scheduled, 0)
-
 def mpu_temp_cb_scheduled(_):
     if not mpu: return
     try:
         temperature = mpu.get_temp()
-        humidity = random.randint(60, 75)
-        
-        push_sensor_data({
-            'sensor': 'mpu_temp',
-            'disp_data': temperature,
-            'temp': temperature
-        })
-        push_sensor_data({
-            'sensor': 'humidity',
-            'disp_data': humidity,
-            'humid': humidity
-        })
+        # No humidity sensor on this path — only the AHT10 reports humidity
+        push_sensor_data({'sensor': 'mpu_temp', 'disp_data': temperature, 'temp': temperature})
 
     except Exception as e:
         push_sensor_data({'sensor': 'mpu_temp', 'error': str(e)})
@@ -190,9 +352,6 @@ def read_aht():
     return None, None
 
 
-def aht10_cb_stub(timer):
-    micropython.schedule(aht10_cb_scheduled, 0)
-
 def aht10_cb_scheduled(_):
     if not aht:
         return
@@ -203,8 +362,10 @@ def aht10_cb_scheduled(_):
             push_sensor_data({'sensor': 'aht10', 'error': 'Read failed'})
             return
 
-        push_sensor_data({'sensor': 'temperature', 'disp_data': temp, 'temp': temp})
-        push_sensor_data({'sensor': 'humidity', 'disp_data': hum, 'humid': hum})
+        push_sensor_data_batch((
+            {'sensor': 'temperature', 'disp_data': temp, 'temp': temp},
+            {'sensor': 'humidity', 'disp_data': hum, 'humid': hum},
+        ))
 
     except Exception as e:
         push_sensor_data({'sensor': 'aht10', 'error': str(e)})
@@ -215,9 +376,6 @@ def aht10_cb_scheduled(_):
 gpio0 = Pin(0, Pin.IN)
 gpio1 = Pin(1, Pin.IN)
 
-def door_cb_stub(timer):
-    micropython.schedule(door_cb_scheduled, 0)
-    
 def door_cb_scheduled(_):
     try:
         d_open = gpio0.value()
@@ -236,34 +394,39 @@ def door_cb_scheduled(_):
 
 
 # --- Power Setup ---
-adc = ADC(Pin(28)) # ADC for battery voltage on GPIO28 (ADC2)
+bat_adc = ADC(Pin(28)) # ADC for battery voltage on GPIO28 (ADC2)
 charger_pin = Pin(10, Pin.IN)# Charger indication input on GPIO10
 # Voltage reference and resistor values
-VREF = 3.3  # Reference voltage for ADC
+VREF_MV = 3300  # Reference voltage for ADC (mV)
 R1 = 10000   # Resistor to battery positive
 R2 = 3600   # Resistor to GND
-# Divider correction factor
-voltage_divider_factor = (R1 + R2) / R2
+# Battery mV at full-scale u16, in Q16: mv = (raw * _VBAT_MV_Q16) >> 16
+# (65535 * 12466 stays inside a small int, so no float or bigint math)
+_VBAT_MV_Q16 = (R1 + R2) * VREF_MV * 65536 // (R2 * 65535)
 
 # --- Rolling Average Setup ---
 WINDOW_SIZE = 10
-voltage_samples = []
+_vbuf = array('i', bytearray(4 * WINDOW_SIZE))  # Fixed ring of recent readings (mV)
+_vidx = 0     # Next slot to overwrite
+_vcount = 0   # Valid readings in the ring (<= WINDOW_SIZE)
+_vsum = 0     # Running sum of the ring contents (mV)
 
 def get_smoothed_voltage():
-    voltage = read_battery_voltage()
-    # Maintain a fixed-size buffer
-    voltage_samples.append(voltage)
-    if len(voltage_samples) > WINDOW_SIZE:
-        voltage_samples.pop(0)
-    
-    avg_voltage = sum(voltage_samples) / len(voltage_samples)
-    return round(avg_voltage, 2)
+    global _vidx, _vcount, _vsum
+    mv = read_battery_voltage()
+    # O(1) ring update: swap the oldest reading out of the running sum
+    _vsum += mv - _vbuf[_vidx]
+    _vbuf[_vidx] = mv
+    _vidx = (_vidx + 1) % WINDOW_SIZE
+    if _vcount < WINDOW_SIZE:
+        _vcount += 1
+
+    # Convert to volts only once, for telemetry
+    return round(_vsum // _vcount / 1000, 2)
 
 def read_battery_voltage():
-    raw = adc.read_u16()
-    voltage_at_pin = (raw / 65535) * VREF
-    actual_voltage = voltage_at_pin * voltage_divider_factor
-    return round(actual_voltage, 2)
+    # Battery voltage in integer millivolts
+    return (bat_adc.read_u16() * _VBAT_MV_Q16) >> 16
 
 def read_charger_status():
     return "OFF" if charger_pin.value() else "ON"
@@ -283,12 +446,16 @@ def exit_low_power_mode():
     #push_sensor_data({'event': 'Exited Low Power Mode'})
     
 # State tracking
-power_state = {
-    'mains': True,
-    'low_power_mode': False,
-    'mains_lost_at': None,
-    'mains_restored_at': None
-}
+class _PowerState:
+    # Plain attributes: qstr slot lookups instead of per-access dict subscripts
+    # (MicroPython ignores __slots__, so none is declared)
+    def __init__(self):
+        self.mains = True
+        self.low_power_mode = False
+        self.mains_lost_at = None
+        self.mains_restored_at = None
+
+power_state = _PowerState()
 
 try:
     POWER_RESTORE_DEBOUNCE_MS = int(config.get('low_power').get('restore_debounce_sec'))*1000
@@ -304,10 +471,13 @@ logger.info(f"LOW_POWER_DELAY_MS: {LOW_POWER_DELAY_MS}")
 
 TICKS_AT_RESET = 15000 #To track if a reset happened in Low Power Mode
 
-def power_cb_stub(timer):
-    micropython.schedule(power_cb_scheduled, 0)
+_BATT_MSG = {'sensor': 'batt', 'disp_data': None, 'V_Batt': None}
+_MAINS_MSG = {'sensor': 'mains', 'disp_data': None, 'AC_Power': None}
+_POWER_MSGS = (_BATT_MSG, _MAINS_MSG)
 
 def power_cb_scheduled(_):
+    ps = power_state
+    td = ticks_diff
     try:
         vbat = get_smoothed_voltage()
         mains_on = read_charger_status() == 'ON'
@@ -315,38 +485,44 @@ def power_cb_scheduled(_):
 
         # Track mains OFF time
         if not mains_on:
-            if power_state['mains']:
-                power_state['mains_lost_at'] = now
+            if ps.mains:
+                ps.mains_lost_at = now
                 logger.warn(f"Mains Power: CUTOFF : {now}")
                 if(now < TICKS_AT_RESET):
                     enter_low_power_mode()
-                    power_state['low_power_mode'] = True
-            power_state['mains_restored_at'] = None  # Cancel recovery debounce
+                    ps.low_power_mode = True
+            ps.mains_restored_at = None  # Cancel recovery debounce
         else:
-            if not power_state['mains']:
-                power_state['mains_restored_at'] = now  # Just restored
+            if not ps.mains:
+                ps.mains_restored_at = now  # Just restored
                 logger.warn(f"Mains Power: RESTORED : {now}")
 
-        power_state['mains'] = mains_on
+        ps.mains = mains_on
 
         # Enter low power mode
-        if not mains_on and power_state['mains_lost_at']:
-            elapsed = ticks_diff(now, power_state['mains_lost_at'])
-            if (elapsed > LOW_POWER_DELAY_MS) and not power_state['low_power_mode']:
+        if not mains_on and ps.mains_lost_at:
+            elapsed = td(now, ps.mains_lost_at)
+            if (elapsed > LOW_POWER_DELAY_MS) and not ps.low_power_mode:
                 enter_low_power_mode()
-                power_state['low_power_mode'] = True
+                ps.low_power_mode = True
 
         # Debounced recovery
-        if mains_on and power_state['low_power_mode'] and power_state['mains_restored_at']:
-            restore_elapsed = ticks_diff(now, power_state['mains_restored_at'])
+        if mains_on and ps.low_power_mode and ps.mains_restored_at:
+            restore_elapsed = td(now, ps.mains_restored_at)
             if restore_elapsed > POWER_RESTORE_DEBOUNCE_MS:
                 exit_low_power_mode()
-                power_state['low_power_mode'] = False
-                power_state['mains_restored_at'] = None  # Clear timestamp after recovery
+                ps.low_power_mode = False
+                ps.mains_restored_at = None  # Clear timestamp after recovery
 
         # Telemetry
-        push_sensor_data({'sensor': 'batt', 'disp_data': f"{vbat}V", 'V_Batt': vbat})
-        push_sensor_data({'sensor': 'mains', 'disp_data': 'ON' if mains_on else 'OFF', 'AC_Power': 'ON' if mains_on else 'OFF'})
+        batt = _BATT_MSG
+        if batt['V_Batt'] != vbat:  # Only re-format when the reading moves
+            batt['V_Batt'] = vbat
+            batt['disp_data'] = f"{vbat}V"
+        mains_str = 'ON' if mains_on else 'OFF'
+        _MAINS_MSG['disp_data'] = mains_str
+        _MAINS_MSG['AC_Power'] = mains_str
+        push_sensor_data_batch(_POWER_MSGS)
 
     except Exception as e:
         push_sensor_data({'sensor': 'Mains', 'error': str(e)})
@@ -354,43 +530,53 @@ def power_cb_scheduled(_):
 
 
 # --- Core 1 Entry Point ---
-def core1_main():
-    global mic_timer, mpu_timer, mpu_temp_timer, door_timer
+# rp2 machine.Timer callbacks are soft IRQs (already run via the scheduler),
+# so the *_cb_scheduled handlers are registered directly.
+def _dispatch(timer):
+    # Round-robin: one sensor per tick, so callbacks never pile up together
+    global _phase
+    cb = _sensor_cbs[_phase]
+    _phase = (_phase + 1) % len(_sensor_cbs)
+    cb(timer)
 
-    mic_timer = Timer()
-    mic_timer.init(freq=1, mode=Timer.PERIODIC, callback=mic_cb_stub)
+def core1_main():
+    global sensor_timer, _sensor_cbs, _phase, _stopping
 
+    cbs = [mic_cb_scheduled]
     if mpu:
-        mpu_timer = Timer()
-        mpu_timer.init(freq=1, mode=Timer.PERIODIC, callback=mpu_cb_stub)
-    
+        cbs.append(mpu_cb_scheduled)
     if aht:
-        aht10_timer = Timer()
-        aht10_timer.init(freq=1, mode=Timer.PERIODIC, callback=aht10_cb_stub)
+        cbs.append(aht10_cb_scheduled)
     elif mpu:
-        mpu_temp_timer = Timer()
-        mpu_temp_timer.init(freq=1, mode=Timer.PERIODIC, callback=mpu_temp_cb_stub)
-        
-    door_timer = Timer()
-    door_timer.init(freq=1, mode=Timer.PERIODIC, callback=door_cb_stub)
-    
-    power_timer = Timer()
-    power_timer.init(freq=1, mode=Timer.PERIODIC, callback=power_cb_stub)
-    
-    while True:
-        utime.sleep(1)
+        cbs.append(mpu_temp_cb_scheduled)
+    cbs.append(door_cb_scheduled)
+    cbs.append(power_cb_scheduled)
+    _sensor_cbs = tuple(cbs)
+    _phase = 0
+
+    # Tick at len(cbs) Hz so every sensor still runs once per second
+    if not _stopping:
+        sensor_timer = Timer()
+        sensor_timer.init(freq=len(_sensor_cbs), mode=Timer.PERIODIC, callback=_dispatch)
+
+    # Park Core 1 on the held lock until stop_core1() releases it (no
+    # periodic wakeups). Returning with it re-held leaves it ready for a restart.
+    _stop_lock.acquire()
+
+    # A stop that landed between the flag check and init() missed this timer
+    if sensor_timer:
+        sensor_timer.deinit()
+        sensor_timer = None
+    _stopping = False
 
 def stop_core1():
-    if mic_timer:
-        mic_timer.deinit()
-    if mpu_timer:
-        mpu_timer.deinit()
-    if mpu_temp_timer:
-        mpu_temp_timer.deinit()
-    if door_timer:
-        door_timer.deinit()
-    if power_timer:
-        power_timer.deinit()
+    global sensor_timer, _stopping
+    if sensor_timer:
+        sensor_timer.deinit()
+        sensor_timer = None
+    if not _stopping:  # Release once per run, even if called repeatedly
+        _stopping = True
+        _stop_lock.release()  # Let core1_main return
     print("🛑 Core 1 timers stopped.")
     
 '''
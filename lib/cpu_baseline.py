@@ -1,34 +1,37 @@
 import uasyncio as asyncio
+import micropython
+from array import array
 
 # Configuration
 BASELINE_DURATION = 5  # duration (in seconds) for idle tick profiling
 
-# Idle tick counter
-idle_counter = 0
+# Idle tick counter (array slot: no global rebinding in the hot loop)
+_idle = array('l', [0])
 
+# Must stay identical to sysmon.idle_task so the baseline is comparable
+@micropython.native
 async def idle_task():
-    global idle_counter
+    c = _idle
     while True:
-        idle_counter += 1
+        c[0] += 1
         await asyncio.sleep_ms(0)
 
 async def main():
-    global idle_counter
-
     print(f"\n📡 Starting idle baseline profiling for {BASELINE_DURATION} seconds...\n")
 
     # Launch only the idle task
     asyncio.create_task(idle_task())
 
     # Clear counter and sleep
-    idle_counter = 0
+    _idle[0] = 0
     await asyncio.sleep(BASELINE_DURATION)
+    idle_counter = _idle[0]
 
     # Print result
     print("✅ Baseline complete.")
     print(f"🧮 Idle ticks recorded: {idle_counter}")
     print(f"📏 Duration: {BASELINE_DURATION} sec")
     print(f"📌 Suggested baseline value: {idle_counter} ticks\n")
-    print("💡 Use this value as your reference for 100% idle when integrating CPU monitoring.\n")
+    print("💡 sysmon calibrates this at boot; use this to check that value.\n")
 
 asyncio.run(main())
\ No newline at end of file
@@ -6,11 +6,12 @@
 ✅ Folder-per-day organization
 '''
 import uasyncio as asyncio
-from simplequeue import Queue
 import time
 import os
 from logger import Logger
 
+AVG_LINE_BYTES = 160  # Sizing hint: buffer holds ~buffer_size lines of this length
+
 
 class DataLogger:
     def __init__(self, sd_manager, log_dir="logs", prefix="log",
@@ -24,15 +25,33 @@ class DataLogger:
         self.flush_interval_s = flush_interval_s  # Max time between flushes
         self.max_file_bytes = max_file_mb * 1024 * 1024  # Rotate if file > 2MB
 
-        self.queue = Queue()
+        # 🧺 Two preallocated buffers of newline-terminated UTF-8 lines:
+        # log() fills the active one while run() writes out the other
+        cap = buffer_size * AVG_LINE_BYTES
+        self._bufs = (bytearray(cap), bytearray(cap))
+        self._mvs = (memoryview(self._bufs[0]), memoryview(self._bufs[1]))
+        self._active = 0
+        self._buf = self._bufs[0]
+        self._mv = self._mvs[0]
+        self._buf_len = 0    # Bytes used in the active buffer
+        self._buf_lines = 0  # Lines in the active buffer
+        self._wake = asyncio.Event()  # Set when a flush is due
+        self._dropped = 0  # Lines lost to a full buffer since the last flush
+
         self._current_filename = None
         self._current_log_dir = None
-        self._log_buffer = []
-        self._last_flush_time = time.time()
-        
-        self._cached_free_space_mb = 9999  # Initial dummy value
-        self._last_space_check = time.time()
-        self.space_check_interval = 60  # seconds
+        # 🗂️ Cached SD state, so a steady-state flush needs no stat/listdir
+        self._today_dir_verified_for = None  # Folder known to exist
+        self._current_file_size = 0          # Bytes in _current_filename
+        self._next_index = None              # Next log_N index ...
+        self._next_index_dir = None          # ... valid for this folder
+        self._today_folder = None
+        self._day_start = 0
+        self._next_rollover = 0  # Forces the first _get_today_folder() to build it
+
+        # Free-space estimate: queried once per mount, then reduced by what we
+        # write; statvfs runs again only near the purge threshold
+        self._cached_free_space_mb = None
 
         # 📁 Ensure base log directory exists at startup (required for rotation)
         try:
@@ -44,8 +63,14 @@ class DataLogger:
 
     def _get_today_folder(self):
         # 📆 Creates path like: logs/2025-07-18/
-        t = time.localtime()
-        return "{}/{}-{:02d}-{:02d}".format(self.log_dir, t[0], t[1], t[2])
+        # Rebuilt only when the date changes (or the RTC is stepped back)
+        now = time.time()
+        if not (self._day_start <= now < self._next_rollover):
+            t = time.localtime(now)
+            self._day_start = now - (t[3] * 3600 + t[4] * 60 + t[5])
+            self._next_rollover = self._day_start + 86400
+            self._today_folder = "{}/{}-{:02d}-{:02d}".format(self.log_dir, t[0], t[1], t[2])
+        return self._today_folder
 
     def _rotate_filename(self):
         """
@@ -61,7 +86,8 @@ class DataLogger:
         if not self.sd.is_dir(self.log_dir):
             try:
                 os.mkdir(base_dir)
-                Logger.info("Created base log directory: {}".format(base_dir))
+                if Logger.INFO_MODE:
+                    Logger.info("Created base log directory: {}".format(base_dir))
             except Exception as e:
                 Logger.error("mkdir failed for base log dir: {}".format(e))
                 return None
@@ -70,24 +96,48 @@ class DataLogger:
         if not self.sd.is_dir("{}/{}".format(self.log_dir, today_folder_name)):
             try:
                 os.mkdir(today_dir)
-                Logger.info("Created folder: {}".format(today_dir))
+                if Logger.INFO_MODE:
+                    Logger.info("Created folder: {}".format(today_dir))
             except Exception as e:
                 Logger.error("mkdir failed for daily folder: {}".format(e))
                 return None
 
-        # 🔁 Determine next file index
+        # 🔁 Determine next file index (scan the folder once per day, then count up)
         relative_today_dir = "{}/{}".format(self.log_dir, today_folder_name)  # used for sd.list_files
-        files = sorted([
-            f for f in self.sd.list_files(relative_today_dir)
-            if f.endswith(".txt")
-        ])
-        next_index = len(files) + 1
+        if self._next_index is None or self._next_index_dir != relative_today_dir:
+            highest = 0
+            for f in self.sd.list_files(relative_today_dir):
+                idx = self._log_index(f)
+                if idx > highest:
+                    highest = idx
+            self._next_index = highest + 1  # Past the highest, even if some were purged
+            self._next_index_dir = relative_today_dir
+        next_index = self._next_index
+        self._next_index += 1
 
         # 📝 Final filename: logs/2025-07-19/log_N.txt
         filename = "{}/log_{}.txt".format(relative_today_dir, next_index)
-        Logger.info("Rotated log to: {}".format(filename))
+        self._current_file_size = self._get_file_size(filename)  # One stat per rotation
+        if Logger.INFO_MODE:
+            Logger.info("Rotated log to: {}".format(filename))
         return filename
 
+    def _log_index(self, name):
+        # "log_12.txt" → 12; anything else → 0
+        if name.startswith("log_") and name.endswith(".txt"):
+            try:
+                return int(name[4:-4])
+            except ValueError:
+                pass
+        return 0
+
+    def _invalidate_sd_cache(self):
+        # SD was unmounted/swapped or a write failed: re-check everything
+        self._today_dir_verified_for = None
+        self._current_filename = None
+        self._next_index = None
+        self._cached_free_space_mb = None
+
     def _get_file_size(self, path):
         try:
             return os.stat(self.sd._full_path(path))[6]  # Returns size in bytes
@@ -109,120 +159,167 @@ class DataLogger:
             Logger.error("Failed to scan log folders: {}".format(e))
             return
 
-        active_folder = self._get_today_folder()
+        active_folder = self._get_today_folder().split("/")[-1]  # Folder name, as listed
 
-        # 🚮 Pass 1: delete files from inactive folders
+        # 🚮 Single walk: delete oldest files, then drop the folder if emptied
         for folder in sorted(folders):
             if folder == active_folder:
                 continue
 
             folder_path = "{}/{}".format(self.log_dir, folder)
             try:
-                files = sorted([
-                    f for f in self.sd.list_files(folder_path)
-                    if f.endswith(".txt")
-                ])
+                files = [f for f in self.sd.list_files(folder_path) if f.endswith(".txt")]
             except Exception as e:
                 Logger.error("Failed to list files in '{}': {}".format(folder_path, e))
                 continue
-
+            remaining = len(files)
+            log_index = self._log_index
             while files and self._cached_free_space_mb < self.min_free_mb:
-                old = files.pop(0)
+                # Single-pass min: oldest (lowest log_N) without sorting the listing
+                oldest_i = 0
+                oldest_n = log_index(files[0])
+                for i in range(1, len(files)):
+                    n = log_index(files[i])
+                    if n < oldest_n:
+                        oldest_i, oldest_n = i, n
+                old = files[oldest_i]
+                files[oldest_i] = files[-1]  # O(1) removal; order doesn't matter
+                files.pop()
                 file_path = "{}/{}".format(folder_path, old)
                 try:
                     os.remove(self.sd._full_path(file_path))
                     Logger.warn("Deleted old log: {}".format(file_path))
                 except Exception as e:
                     Logger.error("File purge failed for '{}': {}".format(file_path, e))
+                    break
+                remaining -= 1
 
-        # 🧼 Pass 2: remove folders with no .txt files
-        for folder in sorted(folders):
-            if folder == active_folder:
-                continue
+                # 🌡️ Re-check space after each delete
+                self._cached_free_space_mb = self.sd.get_free_space_mb()
 
-            folder_path = "{}/{}".format(self.log_dir, folder)
-            try:
-                contents = self.sd.list_files(folder_path)
-                txt_files = [f for f in contents if f.endswith(".txt")]
-                Logger.debug("Folder '{}' contains {} .txt files".format(folder_path, len(txt_files)))
-
-                if not txt_files:
+            # 🧼 Remove folders with no .txt files left
+            if Logger.DEBUG_MODE:
+                Logger.debug("Folder '{}' contains {} .txt files".format(folder_path, remaining))
+            if not remaining:
+                try:
                     os.rmdir(self.sd._full_path(folder_path))
                     Logger.warn("Removed empty folder: {}".format(folder_path))
-            except Exception as e:
-                Logger.error("Folder cleanup failed for '{}': {}".format(folder_path, e))
-        
+                except Exception as e:
+                    Logger.error("Folder cleanup failed for '{}': {}".format(folder_path, e))
+
+    def log(self, line):
+        # Synchronous: copies the line into the active buffer; never awaits.
+        # Accepts str or already-encoded bytes (copied in without re-encoding)
+        data = line.encode() if isinstance(line, str) else line
+        n = len(data) + 1
+        cap = len(self._buf)
+        if n > cap:
+            data = data[:cap - 1]  # ✂️ Oversized line: keep what fits
+            n = cap
+
+        # 🚧 Buffer full — wake the writer and drop this line
+        if self._buf_len + n > cap:
+            self._dropped += 1
+            self._wake.set()
+            return
 
-    async def log(self, line):
-        await self.queue.put(line)
+        end = self._buf_len + n - 1
+        self._mv[self._buf_len:end] = data
+        self._buf[end] = 0x0A
+        self._buf_len = end + 1
+        self._buf_lines += 1
+        if self._buf_lines >= self.buffer_size:
+            self._wake.set()
+
+    def _swap_buffers(self):
+        # 🔀 Hand the filled buffer to the writer; producers move to the other
+        mv, n, lines = self._mv, self._buf_len, self._buf_lines
+        self._active ^= 1
+        self._buf = self._bufs[self._active]
+        self._mv = self._mvs[self._active]
+        self._buf_len = 0
+        self._buf_lines = 0
+        return mv, n, lines
 
     async def run(self):
         while True:
             try:
-                line = await self.queue.get()
-                self._log_buffer.append(line)
-
-                now = time.time()
-                buffer_full = len(self._log_buffer) >= self.buffer_size
-                timeout_exceeded = (now - self._last_flush_time) >= self.flush_interval_s
-
-                if buffer_full or timeout_exceeded:
-                    if not self.sd.mounted:
-                        Logger.warn("SD not mounted — skipping flush")
-                        self._log_buffer.clear()
-                        self._last_flush_time = now
-                        continue
-
-                    # 🌡️ Refresh free space every 60 seconds
-                    if (now - self._last_space_check) >= self.space_check_interval:
-                        self._cached_free_space_mb = self.sd.get_free_space_mb()
-                        self._last_space_check = now
-                        Logger.debug("SD space check: {:.2f} MB free".format(self._cached_free_space_mb))
-
-                    # 🧹 Trigger purge only when space is below threshold
-                    if self._cached_free_space_mb < self.min_free_mb:
-                        self._purge_logs_if_low_space()
-
-                    # 📁 Ensure today's folder is ready
-                    self._current_log_dir = self._get_today_folder()
-
-                    if not self.sd.is_dir(self._current_log_dir):
-                        try:
-                            os.mkdir(self.sd._full_path(self._current_log_dir))
-                            Logger.info("Created folder: {}".format(self._current_log_dir))
-                        except Exception as e:
-                            Logger.error("mkdir failed for {}: {}".format(self._current_log_dir, e))
-                            self._log_buffer.clear()
-                            self._last_flush_time = now
-                            continue
-
-                    # 📄 Ensure filename is aligned with active folder
-                    if (not self._current_filename or
-                        not self._current_filename.startswith(self._current_log_dir)):
-                        self._current_filename = self._rotate_filename()
-
-                    # 🔁 Rotate file if size exceeds limit
-                    current_size = self._get_file_size(self._current_filename)
-                    if current_size >= self.max_file_bytes:
-                        self._current_filename = self._rotate_filename()
-
-                    # ✏️ Write buffered data to file
-                    data = "\n".join(self._log_buffer) + "\n"
-                    try:
-                        self.sd.write_file(self._current_filename, data, append=True, safe=False)
-                    except MemoryError:
-                        Logger.error("SD write failed due to MemoryError — heap may be locked")
-                        self._log_buffer.clear()  # Optional safety flush
-                        await asyncio.sleep(0.5)  # Let the system recover
-
-                    Logger.debug("Flushed {} log line(s) → {}".format(len(self._log_buffer), self._current_filename))
-                    self._log_buffer.clear()
-                    self._last_flush_time = now
+                # ⏳ Flush when the buffer fills or flush_interval_s passes
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.flush_interval_s)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+
+                if not self._buf_len:
+                    continue
+
+                if self._dropped:
+                    Logger.warn("Log buffer full — dropped {} line(s)".format(self._dropped))
+                    self._dropped = 0
+
+                mv, n, lines = self._swap_buffers()
+                await self._flush(mv, n, lines)
 
             except Exception as e:
                 Logger.error("Logging error in run(): {}".format(e))
                 await asyncio.sleep(1)
 
+    async def _flush(self, mv, n, lines):
+        if not self.sd.mounted:
+            Logger.warn("SD not mounted — skipping flush")
+            self._invalidate_sd_cache()
+            return
+
+        # 🌡️ Query real free space on first use after mount, or near the threshold
+        if (self._cached_free_space_mb is None or
+            self._cached_free_space_mb < self.min_free_mb * 1.2):
+            self._cached_free_space_mb = self.sd.get_free_space_mb()
+            if Logger.DEBUG_MODE:
+                Logger.debug("SD space check: {:.2f} MB free".format(self._cached_free_space_mb))
+
+        # 🧹 Trigger purge only when space is below threshold
+        if self._cached_free_space_mb < self.min_free_mb:
+            self._purge_logs_if_low_space()
+
+        # 📁 Ensure today's folder is ready
+        self._current_log_dir = self._get_today_folder()
+
+        if self._current_log_dir != self._today_dir_verified_for:
+            if not self.sd.is_dir(self._current_log_dir):
+                try:
+                    os.mkdir(self.sd._full_path(self._current_log_dir))
+                    if Logger.INFO_MODE:
+                        Logger.info("Created folder: {}".format(self._current_log_dir))
+                except Exception as e:
+                    Logger.error("mkdir failed for {}: {}".format(self._current_log_dir, e))
+                    return
+            self._today_dir_verified_for = self._current_log_dir
+
+        # 📄 Ensure filename is aligned with active folder
+        if (not self._current_filename or
+            not self._current_filename.startswith(self._current_log_dir)):
+            self._current_filename = self._rotate_filename()
+
+        # 🔁 Rotate file if size exceeds limit (size tracked locally)
+        if self._current_file_size >= self.max_file_bytes:
+            self._current_filename = self._rotate_filename()
+
+        # ✏️ Write buffered data to file in one contiguous write
+        try:
+            if self.sd.write_file(self._current_filename, mv[:n], append=True, safe=False):
+                self._current_file_size += n
+                self._cached_free_space_mb -= n / (1024 * 1024)
+            else:
+                self._invalidate_sd_cache()
+        except MemoryError:
+            Logger.error("SD write failed due to MemoryError — heap may be locked")
+            await asyncio.sleep(0.5)  # Let the system recover
+
+        if Logger.DEBUG_MODE:  # Guarded so the format() is skipped when off
+            Logger.debug("Flushed {} log line(s) → {}".format(lines, self._current_filename))
+
+
 if __name__ == "__main__":
     import uasyncio as asyncio
     import time
@@ -235,7 +332,7 @@ if __name__ == "__main__":
         while True:
             t_ms = time.ticks_ms()
             msg = "Sensor reading at t={} ms".format(t_ms)
-            await datalogger.log(msg)
+            datalogger.log(msg)
             Logger.debug("Queued: {}".format(msg))
             await asyncio.sleep(1)
 
@@ -4,13 +4,24 @@ from machine import UART, Pin
 from logger import debug, info, warn, error
 
 class LaserModule:
+    # mode -> (payload, checksum, response delay in ms)
+    _MEASURE_CMDS = {
+        "auto": (b'\x00\x20\x00\x01\x00\x00', b'\x21', 600),
+        "fast": (b'\x00\x20\x00\x01\x00\x02', b'\x23', 150),
+    }
+
     def __init__(self, uart_id=0, baudrate=115200, tx_pin=12, rx_pin=13, pwr_pin=11):
         """
         Initialize laser module with UART and power pin.
         """
         self.uart = UART(uart_id, baudrate=baudrate, stop=1, tx=Pin(tx_pin), rx=Pin(rx_pin))
         self.pwr = Pin(pwr_pin, Pin.OUT)
-        self.buffer = bytearray()
+        self._rx_buf = bytearray(64)  # Response bytes land here; no per-read growth
+        self._rx_mv = memoryview(self._rx_buf)
+        self._tx_buf = bytearray(10)  # 0xAA 0x00 + payload (<= 7) + checksum
+        self._tx_buf[0] = 0xAA
+        self._tx_buf[1] = 0x00
+        self._tx_mv = memoryview(self._tx_buf)
         self.timeout_ms = 700
         self.seq = {}
         self.payload = {}
@@ -41,28 +52,41 @@ class LaserModule:
 
     async def _send_packet(self, payload: bytes, checksum_byte: bytes):
         """Construct and transmit UART packet."""
-        packet = b'\xAA\x00' + payload + checksum_byte
-        self.uart.write(packet)
-        await asyncio.sleep_ms(20)
+        # Drop leftovers (trailing bytes, duplicate or late frames) so the
+        # early-return reader can't take them as this command's reply
+        uart, mv = self.uart, self._rx_mv
+        while uart.any():
+            uart.readinto(mv)
+        n = len(payload)
+        self._tx_buf[2:2 + n] = payload
+        self._tx_buf[2 + n] = checksum_byte[0]
+        self.uart.write(self._tx_mv[:3 + n])
+        # Wait only for the bytes to leave (~1 ms at 115200), not a fixed 20 ms
+        while not self.uart.txdone():
+            await asyncio.sleep_ms(1)
 
     async def _read_uart_response(self) -> bytes:
         """Read UART response with timeout and extract valid frame."""
-        self.buffer = bytearray()
+        rx, mv = self._rx_buf, self._rx_mv
+        uart = self.uart
+        pos = 0   # Bytes received
+        scan = 0  # Next offset to test as a frame start
         start = utime.ticks_ms()
 
-        while utime.ticks_diff(utime.ticks_ms(), start) < self.timeout_ms:
-            if self.uart.any():
-                self.buffer += self.uart.read(1)
-            await asyncio.sleep_ms(2)
-
-        buf = bytes(self.buffer)
-        for i in range(len(buf) - 12):
-            if buf[i] == 0xAA:
-                frame = buf[i:i+13]
-                if len(frame) == 13:
-                    return frame
-
-        warn(f"Laser: No valid frame in response — {buf}")
+        while utime.ticks_diff(utime.ticks_ms(), start) < self.timeout_ms and pos < len(rx):
+            n = uart.any()
+            if n:
+                got = uart.readinto(mv[pos:], min(n, len(rx) - pos))
+                if got:
+                    pos += got
+                # Return as soon as a full 13-byte frame anchored on 0xAA is in
+                while scan <= pos - 13:
+                    if rx[scan] == 0xAA:
+                        return bytes(mv[scan:scan + 13])
+                    scan += 1
+            await asyncio.sleep_ms(5)
+
+        warn(f"Laser: No valid frame in response — {bytes(mv[:pos])}")
         return b''
 
     async def get_status(self) -> bytes:
@@ -79,14 +103,8 @@ class LaserModule:
     async def measure(self, mode: str = "fast") -> int:
         """Trigger a distance measurement and return result in mm."""
         try:
-            if mode == "auto":
-                payload = b'\x00\x20\x00\x01\x00\x00'
-                checksum = b'\x21'
-                delay_ms = 600
-            else:
-                payload = b'\x00\x20\x00\x01\x00\x02'
-                checksum = b'\x23'
-                delay_ms = 150
+            cmds = LaserModule._MEASURE_CMDS
+            payload, checksum, delay_ms = cmds.get(mode) or cmds["fast"]
 
             await self._send_packet(payload, checksum)
             await asyncio.sleep_ms(delay_ms)
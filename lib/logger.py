@@ -9,7 +9,6 @@
 import time
 import os
 import sys
-from machine import UART, Pin
 
 class Logger:
     # Log level controls
@@ -22,6 +21,7 @@ class Logger:
     REPL_ENABLED = True
     STORAGE_ENABLED = True
     UART_ENABLED = True
+    UART_COLOR = True  # False: plain "[LEVEL] msg" on UART for non-ANSI receivers
 
     # UART instance (deferred setup)
     UART_PORT = None
@@ -33,10 +33,23 @@ class Logger:
         "WARN":  "\033[93m",
         "ERROR": "\033[91m",
     }
+    # Precomputed "<color>[LEVEL] " prefixes, keyed by the label written out
+    _PREFIX = {
+        "DEBUG":   "\033[90m[DEBUG] ",
+        "INFO":    "\033[94m[INFO] ",
+        "WARNING": "\033[93m[WARNING] ",
+        "ERROR":   "\033[91m[ERROR] ",
+    }
+    _UART_PREFIX = {lvl: p.encode() for lvl, p in _PREFIX.items()}
+    _UART_SUFFIX = b"\033[0m\r\n"
+    _UART_PLAIN_PREFIX = {lvl: "[{}] ".format(lvl).encode() for lvl in _PREFIX}
+    _UART_PLAIN_SUFFIX = b"\r\n"
 
     LOG_FILE = "/bootlog.txt"
     MAX_LOG_SIZE = 100 * 1024  # 100 KB
     ROTATE_COUNTER_FILE = "/bootlog.iter"
+    _cached_size = None  # Bytes in LOG_FILE; stat'ed once, then tracked per write
+    _log_fh = None       # LOG_FILE kept open for append between writes
 
     @staticmethod
     def _write_log_file(level, msg):
@@ -44,21 +57,37 @@ class Logger:
             if Logger._file_too_big():
                 rotation_id = Logger._increment_rotation_counter()
                 archived = Logger.LOG_FILE + ".old"
+                if Logger._log_fh is not None:
+                    Logger._log_fh.close()  # Must be closed before rename
+                    Logger._log_fh = None
                 try:
-                    if Logger._file_exists(archived):
+                    try:
                         os.remove(archived)
+                    except OSError:
+                        pass  # No previous archive
                     os.rename(Logger.LOG_FILE, archived)
                 except Exception as rotate_err:
                     sys.print_exception(rotate_err)
 
-                with open(Logger.LOG_FILE, "w") as f:
-                    f.write("🗂 Log rotated | Iteration #: {}\r\n".format(rotation_id))
+                Logger._log_fh = open(Logger.LOG_FILE, "w")
+                Logger._cached_size = Logger._log_fh.write("🗂 Log rotated | Iteration #: {}\r\n".format(rotation_id))
+
+            if Logger._log_fh is None:
+                Logger._log_fh = open(Logger.LOG_FILE, "a")
 
             ts = Logger._get_ts()
             line = "[{}] [{}] {}\r\n".format(ts, level, msg)
-            with open(Logger.LOG_FILE, "a") as f:
-                f.write(line)
+            f = Logger._log_fh
+            Logger._cached_size += f.write(line)  # write() returns bytes written
+            if level in ("WARNING", "ERROR"):
+                f.flush()  # Make the important lines durable right away
         except Exception as write_err:
+            if Logger._log_fh is not None:
+                try:
+                    Logger._log_fh.close()
+                except Exception:
+                    pass
+                Logger._log_fh = None  # Reopen on the next write
             sys.print_exception(write_err)
 
     @staticmethod
@@ -66,10 +95,17 @@ class Logger:
         try:
             if Logger.UART_ENABLED:
                 if Logger.UART_PORT is None:
+                    from machine import UART, Pin  # Only needed on first UART use
                     Logger.UART_PORT = UART(1, baudrate=115200, tx=Pin(8), rx=Pin(9))
-                color = Logger._COLORS.get(level, "")
-                line = "{}[{}] {}{}\r\n".format(color, level, msg, Logger._RESET)
-                Logger.UART_PORT.write(line)
+                uart = Logger.UART_PORT
+                if Logger.UART_COLOR:
+                    uart.write(Logger._UART_PREFIX[level])
+                    uart.write(str(msg))
+                    uart.write(Logger._UART_SUFFIX)
+                else:
+                    uart.write(Logger._UART_PLAIN_PREFIX[level])
+                    uart.write(str(msg))
+                    uart.write(Logger._UART_PLAIN_SUFFIX)
         except Exception as uart_err:
             sys.print_exception(uart_err)
 
@@ -85,22 +121,23 @@ class Logger:
 
     @staticmethod
     def _file_too_big():
-        try:
-            if not Logger._file_exists(Logger.LOG_FILE):
-                return False
-            return os.stat(Logger.LOG_FILE)[6] > Logger.MAX_LOG_SIZE
-        except Exception as stat_err:
-            sys.print_exception(stat_err)
-            return False
+        if Logger._cached_size is None:
+            try:
+                Logger._cached_size = os.stat(Logger.LOG_FILE)[6]
+            except OSError:
+                Logger._cached_size = 0  # Not created yet
+        return Logger._cached_size > Logger.MAX_LOG_SIZE
 
     @staticmethod
     def _increment_rotation_counter():
         try:
-            if not Logger._file_exists(Logger.ROTATE_COUNTER_FILE):
+            try:
+                f = open(Logger.ROTATE_COUNTER_FILE, "r+")
+            except OSError:
                 with open(Logger.ROTATE_COUNTER_FILE, "w") as f:
                     f.write("1")
                 return 1
-            with open(Logger.ROTATE_COUNTER_FILE, "r+") as f:
+            with f:
                 val = int(f.read().strip())
                 f.seek(0)
                 f.write(str(val + 1))
@@ -109,20 +146,11 @@ class Logger:
             sys.print_exception(count_err)
             return 0
 
-    @staticmethod
-    def _file_exists(path):
-        try:
-            folder = "/".join(path.split("/")[:-1]) or "."
-            fname = path.split("/")[-1]
-            return fname in os.listdir(folder)
-        except:
-            return False
-
     @staticmethod
     def debug(msg):
         if Logger.DEBUG_MODE:
             if Logger.REPL_ENABLED:
-                print(f"{Logger._COLORS['DEBUG']}[DEBUG] {msg}{Logger._RESET}")
+                print(Logger._PREFIX["DEBUG"], msg, Logger._RESET, sep="")
             if Logger.STORAGE_ENABLED:
                 Logger._write_log_file("DEBUG", msg)
             Logger._uart_log("DEBUG", msg)
@@ -131,7 +159,7 @@ class Logger:
     def info(msg):
         if Logger.INFO_MODE:
             if Logger.REPL_ENABLED:
-                print(f"{Logger._COLORS['INFO']}[INFO] {msg}{Logger._RESET}")
+                print(Logger._PREFIX["INFO"], msg, Logger._RESET, sep="")
             if Logger.STORAGE_ENABLED:
                 Logger._write_log_file("INFO", msg)
             Logger._uart_log("INFO", msg)
@@ -140,7 +168,7 @@ class Logger:
     def warn(msg):
         if Logger.WARN_MODE:
             if Logger.REPL_ENABLED:
-                print(f"{Logger._COLORS['WARN']}[WARNING] {msg}{Logger._RESET}")
+                print(Logger._PREFIX["WARNING"], msg, Logger._RESET, sep="")
             if Logger.STORAGE_ENABLED:
                 Logger._write_log_file("WARNING", msg)
             Logger._uart_log("WARNING", msg)
@@ -149,7 +177,7 @@ class Logger:
     def error(msg):
         if Logger.ERROR_MODE:
             if Logger.REPL_ENABLED:
-                print(f"{Logger._COLORS['ERROR']}[ERROR] {msg}{Logger._RESET}")
+                print(Logger._PREFIX["ERROR"], msg, Logger._RESET, sep="")
             if Logger.STORAGE_ENABLED:
                 Logger._write_log_file("ERROR", msg)
             Logger._uart_log("ERROR", msg)
@@ -1,5 +1,6 @@
 from machine import I2C
 import utime
+import ustruct
 
 MPU_ADDR = 0x68
 
@@ -8,38 +9,70 @@ PWR_MGMT_1 = 0x6B
 ACCEL_XOUT_H = 0x3B
 GYRO_XOUT_H = 0x43
 TEMP_OUT_H = 0x41
+SMPLRT_DIV = 0x19
+FIFO_EN = 0x23
+USER_CTRL = 0x6A
+FIFO_COUNT_H = 0x72
+FIFO_R_W = 0x74
 
 class MPU6050:
     def __init__(self, i2c: I2C, addr=MPU_ADDR):
         self.i2c = i2c
         self.addr = addr
+        self._buf6 = bytearray(6)
+        self._buf2 = bytearray(2)
+        self._buf14 = bytearray(14)
         self.init()
 
     def init(self):
         try:
             self.i2c.writeto_mem(self.addr, PWR_MGMT_1, b'\x00')  # Wake up
             utime.sleep_ms(100)
+            self.i2c.writeto_mem(self.addr, SMPLRT_DIV, b'\x07')  # 8 kHz / (1 + 7) = 1 kHz
+            self.i2c.writeto_mem(self.addr, FIFO_EN, b'\x08')     # Accel frames only
         except Exception as e:
             raise RuntimeError(f"MPU6050 init failed: {e}")
 
     def _read16(self, reg):
-        raw = self.i2c.readfrom_mem(self.addr, reg, 2)
-        val = (raw[0] << 8) | raw[1]
-        return val - 65536 if val > 32767 else val
+        # Big-endian int16; ustruct does the byte swap + sign extension in C
+        self.i2c.readfrom_mem_into(self.addr, reg, self._buf2)
+        return ustruct.unpack_from(">h", self._buf2)[0]
 
     def get_accel(self):
-        return {
-            'x': self._read16(ACCEL_XOUT_H) / 16384.0,
-            'y': self._read16(ACCEL_XOUT_H + 2) / 16384.0,
-            'z': self._read16(ACCEL_XOUT_H + 4) / 16384.0
-        }
+        """(x, y, z) in g from one 6-byte burst read"""
+        self.i2c.readfrom_mem_into(self.addr, ACCEL_XOUT_H, self._buf6)
+        x, y, z = ustruct.unpack(">hhh", self._buf6)
+        return (x / 16384.0, y / 16384.0, z / 16384.0)
+
+    def start_accel_fifo(self):
+        """Clear the FIFO and start capturing 6-byte accel frames at 1 kHz"""
+        self.i2c.writeto_mem(self.addr, USER_CTRL, b'\x04')  # FIFO_RESET
+        self.i2c.writeto_mem(self.addr, USER_CTRL, b'\x40')  # FIFO_EN
+
+    def stop_fifo(self):
+        self.i2c.writeto_mem(self.addr, USER_CTRL, b'\x00')
+
+    def fifo_count(self):
+        self.i2c.readfrom_mem_into(self.addr, FIFO_COUNT_H, self._buf2)
+        return (self._buf2[0] << 8) | self._buf2[1]
+
+    def read_fifo_into(self, buf):
+        """Drain len(buf) bytes from the FIFO in a single burst read"""
+        self.i2c.readfrom_mem_into(self.addr, FIFO_R_W, buf)
 
     def get_gyro(self):
-        return {
-            'x': self._read16(GYRO_XOUT_H) / 131.0,
-            'y': self._read16(GYRO_XOUT_H + 2) / 131.0,
-            'z': self._read16(GYRO_XOUT_H + 4) / 131.0
-        }
+        """(x, y, z) in deg/s from one 6-byte burst read"""
+        self.i2c.readfrom_mem_into(self.addr, GYRO_XOUT_H, self._buf6)
+        x, y, z = ustruct.unpack(">hhh", self._buf6)
+        return (x / 131.0, y / 131.0, z / 131.0)
+
+    def read_all(self):
+        """(ax, ay, az, temp, gx, gy, gz) from one 14-byte burst over 0x3B..0x48"""
+        self.i2c.readfrom_mem_into(self.addr, ACCEL_XOUT_H, self._buf14)
+        ax, ay, az, t, gx, gy, gz = ustruct.unpack(">hhhhhhh", self._buf14)
+        return (ax / 16384.0, ay / 16384.0, az / 16384.0,
+                t / 340.0 + 36.53,
+                gx / 131.0, gy / 131.0, gz / 131.0)
 
     def get_temp(self):
         return self._read16(TEMP_OUT_H) / 340.0 + 36.53
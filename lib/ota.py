@@ -1,11 +1,204 @@
 import uasyncio as asyncio
-import urequests as requests
+import usocket as socket
+import ussl as ssl
 import os
 import json
 import hashlib
 import binascii
+import micropython
 import logger
 
+def path_exists(path):
+    # Single stat instead of listing the whole parent directory
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+IO_CHUNK = 4096  # Download/copy chunk: one littlefs block per read/write
+
+# Files to be excluded during OTA process (user-owned, never overwritten)
+_USER_EXCLUDED = {"config.json", "output_info.txt"}
+
+@micropython.viper
+def _strip_crlf(buf: ptr8, n: int) -> int:
+    # Drop each CR that precedes an LF, compacting in place; returns new length
+    j = 0
+    i = 0
+    while i < n:
+        b = buf[i]
+        if b == 0x0D and i + 1 < n and buf[i + 1] == 0x0A:
+            i += 1
+            continue
+        buf[j] = b
+        j += 1
+        i += 1
+    return j
+
+#------------------------------------------------------------------------------#
+class _HTTPResponse:
+    """Body reader for one response on a kept-alive _HTTPSession socket"""
+    def __init__(self, session, status_code, headers, length, chunked, reusable):
+        self.status_code = status_code
+        self.headers = headers  # Lower-cased header name → value (str)
+        self._session = session
+        self._sock = session._sock
+        self._remaining = length  # Bytes left (or left in chunk); None → until close
+        self._chunked = chunked
+        self._reusable = reusable
+        self._done = False
+
+    def _finish(self, ok=True):
+        self._done = True
+        if not (ok and self._reusable):
+            self._session.close()
+        return b""
+
+    def _want(self, n):
+        # Bytes to ask the socket for next (at most n); 0 once the body is complete
+        if self._done:
+            return 0
+        if self._chunked:
+            if not self._remaining:
+                size = int(self._sock.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    while self._sock.readline() not in (b"\r\n", b"\n", b""):
+                        pass  # Skip trailers
+                    self._finish()
+                    return 0
+                self._remaining = size
+            return min(n, self._remaining)
+        if self._remaining is None:
+            return n
+        if self._remaining <= 0:
+            self._finish()
+            return 0
+        return min(n, self._remaining)
+
+    def _got(self, k):
+        # Account for k bytes just read; 0 means the peer hung up mid-body
+        if not k:
+            self._finish(False)
+            return 0
+        if self._remaining is not None:
+            self._remaining -= k
+            if self._chunked and not self._remaining:
+                self._sock.readline()  # CRLF closing the chunk
+        return k
+
+    def read(self, n=IO_CHUNK):
+        want = self._want(n)
+        if not want:
+            return b""
+        data = self._sock.read(want)
+        return data if self._got(len(data) if data else 0) else b""
+
+    def readinto(self, mv):
+        # Fill a caller-owned memoryview; no per-chunk allocation for the body
+        want = self._want(len(mv))
+        if not want:
+            return 0
+        return self._got(self._sock.readinto(mv if want == len(mv) else mv[:want]) or 0)
+
+    @property
+    def content(self):
+        parts = []
+        while True:
+            chunk = self.read(IO_CHUNK)
+            if not chunk:
+                break
+            parts.append(chunk)
+        return b"".join(parts)
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        # A partly read body leaves the stream mid-message: drop the socket
+        if not self._done:
+            self._finish(False)
+
+#------------------------------------------------------------------------------#
+class _HTTPSession:
+    """Minimal HTTP/1.1 client that keeps one TCP/TLS connection alive
+    across GETs to the same host, so N files cost one handshake, not N."""
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self._sock = None
+        self._key = None
+
+    def _connect(self, proto, host, port):
+        ai = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0]
+        sock = socket.socket(ai[0], socket.SOCK_STREAM, ai[2])
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(ai[-1])
+            if proto == "https:":
+                sock = ssl.wrap_socket(sock, server_hostname=host)
+        except Exception:
+            sock.close()
+            raise
+        self._sock = sock
+        self._key = (proto, host, port)
+
+    def close(self):
+        if self._sock:
+            try:
+                self._sock.close()
+            except Exception:
+                pass
+        self._sock = None
+        self._key = None
+
+    def get(self, url, headers=None):
+        proto, _, host, path = url.split("/", 3)
+        port = 443 if proto == "https:" else 80
+        if ":" in host:
+            host, port = host.split(":", 1)
+            port = int(port)
+        extra = "".join("{}: {}\r\n".format(k, v) for k, v in headers.items()) if headers else ""
+        req = "GET /{} HTTP/1.1\r\nHost: {}\r\nConnection: keep-alive\r\n{}\r\n".format(path, host, extra).encode()
+
+        # Reuse the open connection; if the server already dropped it, reconnect once
+        for attempt in range(2):
+            fresh = self._key != (proto, host, port)
+            if fresh:
+                self.close()
+                self._connect(proto, host, port)
+            try:
+                self._sock.write(req)
+                status_line = self._sock.readline()
+                if not status_line:
+                    raise OSError("connection closed")
+                break
+            except OSError:
+                self.close()
+                if fresh or attempt:
+                    raise
+
+        status_code = int(status_line.split(None, 2)[1])
+        resp_headers = {}
+        while True:
+            line = self._sock.readline()
+            if not line or line == b"\r\n":
+                break
+            name, _, value = line.decode().partition(":")
+            resp_headers[name.strip().lower()] = value.strip()
+
+        length, chunked = None, False
+        reusable = resp_headers.get("connection", "").lower() != "close"
+        if status_code in (204, 304):
+            length = 0  # No body by definition
+        elif "chunked" in resp_headers.get("transfer-encoding", "").lower():
+            chunked, length = True, 0
+        elif "content-length" in resp_headers:
+            length = int(resp_headers["content-length"])
+        else:
+            reusable = False  # Body runs until the server closes
+        return _HTTPResponse(self, status_code, resp_headers, length, chunked, reusable)
+
+#------------------------------------------------------------------------------#
 class OTAUpdater:
     def __init__(self, repo_url, version_file="/version.txt", ota_dir="/update", backup_dir="/backup"):
         self.repo_url = repo_url.rstrip("/")
@@ -20,11 +213,12 @@ class OTAUpdater:
         self.remote_version = ""
         self.progress = 0
         self.current_file = ""
-        #Files to be excluded during OTA process
-        self.user_excluded = {
-            "config.json",
-            "output_info.txt"
-        }
+        self._http = None  # Keep-alive session shared by manifest + file fetches
+        self._copy_buf = None  # Lazily allocated IO_CHUNK buffer for file copies
+        self._dirs_created = set()  # Dirs known to exist; reset per operation
+        self._manifest_etag = None     # Validators of the cached manifest, sent
+        self._manifest_lastmod = None  # back so an unchanged one costs a 304
+        self._manifest_raw = b""  # Manifest exactly as served; persisted verbatim
     
     #--------------------------------------------------------------------------#
     def get_progress(self):
@@ -44,42 +238,98 @@ class OTAUpdater:
     
     #--------------------------------------------------------------------------#
     async def _ensure_dirs(self, path):
-        parts = path.split("/")[:-1]
+        # Each directory is mkdir'ed at most once per operation (see _dirs_created)
+        parent = path.rsplit("/", 1)[0]
+        if not parent or parent in self._dirs_created:
+            return
         current = ""
-        for p in parts:
-            current = f"{current}/{p}" if current else f"/{p}"
+        for p in parent.split("/"):
+            if not p:
+                continue
+            current = f"{current}/{p}"
+            if current in self._dirs_created:
+                continue
             try:
                 os.mkdir(current)
                 logger.debug(f"Created directory: {current}")
             except:
                 pass
+            self._dirs_created.add(current)
     
     #--------------------------------------------------------------------------#
     def _should_normalize(self, file_path):
         return file_path.endswith((".py", ".txt", ".json", ".md"))
 
     #--------------------------------------------------------------------------#
-    def _sha256(self, path):
-        h = hashlib.sha256()
-        with open(path, "rb") as f:
+    def _session(self):
+        if self._http is None:
+            self._http = _HTTPSession()
+        return self._http
+
+    #--------------------------------------------------------------------------#
+    def close(self):
+        """Drop the kept-alive connection (safe to call at any time)"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    #--------------------------------------------------------------------------#
+    def _copy_file(self, src, dst):
+        # Fixed-size chunks through one reused buffer: RAM use is independent of file size
+        if self._copy_buf is None:
+            self._copy_buf = bytearray(IO_CHUNK)
+        buf = self._copy_buf
+        mv = memoryview(buf)
+        with open(src, "rb") as r, open(dst, "wb") as w:
             while True:
-                chunk = f.read(1024)
-                if not chunk:
+                n = r.readinto(buf)
+                if not n:
                     break
-                h.update(chunk)
+                w.write(mv[:n])
+
+    def _file_sha256(self, path):
+        # Hex digest of a local file, or None if it can't be read
+        if self._copy_buf is None:
+            self._copy_buf = bytearray(IO_CHUNK)
+        buf = self._copy_buf
+        mv = memoryview(buf)
+        h = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    h.update(mv[:n])
+        except OSError:
+            return None
         return binascii.hexlify(h.digest()).decode()
-    
+
     #--------------------------------------------------------------------------#
     async def check_for_update(self):
+        update = await self._check_manifest()
+        if not update:
+            self.close()  # Nothing to download: free the TLS buffers now
+        return update
+
+    #--------------------------------------------------------------------------#
+    async def _check_manifest(self):
         try:
             # 🔁 Retry manifest fetch up to 3 times
             r = None
+            headers = {}
+            if self.remote_version:  # Only when a parsed manifest is cached
+                if self._manifest_etag:
+                    headers["If-None-Match"] = self._manifest_etag
+                if self._manifest_lastmod:
+                    headers["If-Modified-Since"] = self._manifest_lastmod
             for attempt in range(3):
                 try:
-                    r = requests.get(self.manifest_url, timeout=5)
-                    if r.status_code == 200:
+                    r = self._session().get(self.manifest_url, headers)
+                    if r.status_code in (200, 304):
                         break
                     else:
+                        r.close()
                         logger.warn(f"Manifest fetch HTTP {r.status_code}")
                         return False
                 except Exception as e:
@@ -93,35 +343,22 @@ class OTAUpdater:
                 logger.error("OTA: Manifest response object missing.")
                 return False
 
-            # 📦 Parse and validate manifest
-            try:
-                self.manifest = r.json()
-            except Exception as e:
-                logger.error(f"Manifest JSON decode failed: {e}")
-                return False
-
-            if not isinstance(self.manifest, dict):
-                logger.error("OTA: Manifest is not a valid dictionary")
-                return False
-
-            self.remote_version = self.manifest.get("version", "")
-            if not isinstance(self.remote_version, str) or not self.remote_version:
-                logger.error("OTA: Remote version is missing or malformed")
-                return False
-
-            files_meta = self.manifest.get("files") or {}
-            if not isinstance(files_meta, dict):
-                logger.error("OTA: Manifest files section is malformed")
-                return False
-
-            self.hashes = {k: v["sha256"] for k, v in files_meta.items() if "sha256" in v}
-            self.sizes = {k: v["size"] for k, v in files_meta.items() if "size" in v}
-            self.files = list(self.hashes.keys())
-
-            logger.info(f"🧾 Manifest file count: {len(self.files)}")
-            if self.files:
-                first_file = next(iter(self.files))
-                logger.debug(f"🗂 First file in manifest: {first_file}")
+            if r.status_code == 304:
+                logger.debug("🧾 Manifest not modified — reusing cached copy")
+            else:
+                self._manifest_etag = self._manifest_lastmod = None
+                # 📦 Parse and validate manifest
+                try:
+                    raw = r.content
+                    manifest = json.loads(raw)
+                except Exception as e:
+                    logger.error(f"Manifest JSON decode failed: {e}")
+                    return False
+                if not self._load_manifest(manifest):
+                    return False
+                self._manifest_raw = raw
+                self._manifest_etag = r.headers.get("etag")
+                self._manifest_lastmod = r.headers.get("last-modified")
 
             # 📊 Compare local and remote versions
             local = await self._get_local_version()
@@ -140,30 +377,109 @@ class OTAUpdater:
             self.files = []
             return False
     
+    #--------------------------------------------------------------------------#
+    def _load_manifest(self, m):
+        # Shared by check_for_update and apply_update: validate and index in one pass
+        if not isinstance(m, dict):
+            logger.error("OTA: Manifest is not a valid dictionary")
+            return False
+
+        version = m.get("version", "")
+        if not isinstance(version, str) or not version:
+            logger.error(f"OTA: Remote version is missing or malformed → {m}")
+            return False
+
+        files_meta = m.get("files") or {}
+        if not isinstance(files_meta, dict):
+            logger.error("OTA: Manifest files section is malformed")
+            return False
+
+        hashes, sizes, files = {}, {}, []
+        for k, v in files_meta.items():
+            if "sha256" in v:
+                hashes[k] = v["sha256"]
+                files.append(k)
+                if "size" in v:
+                    sizes[k] = v["size"]
+
+        self.manifest = m
+        self.remote_version = version
+        self.hashes, self.sizes, self.files = hashes, sizes, files
+
+        logger.info(f"🧾 Manifest file count: {len(files)}")
+        if files:
+            logger.debug(f"🗂 First file in manifest: {files[0]}")
+        return True
+
     #--------------------------------------------------------------------------#
     async def download_update(self):
+        self._dirs_created = set()
+        if path_exists(self.ota_dir):
+            # Start from an empty stage: files left by an aborted attempt must not
+            # be applied in place of ones this run skips as unchanged
+            self._rmtree(self.ota_dir)
+            logger.debug(f"Cleared stale OTA directory: {self.ota_dir}")
+        else:
+            try:
+                os.mkdir(self.ota_dir)
+                logger.info(f"Created OTA directory: {self.ota_dir}")
+            except OSError as e:
+                logger.error(f"Could not create OTA directory: {e}")
+                return False
+
         try:
-            os.mkdir(self.ota_dir)
-            logger.info(f"Created OTA directory: {self.ota_dir}")
-        except:
-            logger.debug(f"OTA directory already exists: {self.ota_dir}")
+            return await self._download_files()
+        finally:
+            self.close()
 
+    #--------------------------------------------------------------------------#
+    async def _download_files(self):
         total = len(self.files)
+        # One receive buffer for the whole run: a held-back CR slot + one chunk
+        buf = bytearray(IO_CHUNK + 1)
+        mv = memoryview(buf)
+        body = (mv[:IO_CHUNK], mv[1:])  # Receive window without / with a carried CR
         for i, file in enumerate(self.files):
             url = f"{self.repo_url}/{file}"
             dest = f"{self.ota_dir}/{file}"
-            await self._ensure_dirs(dest)
             self.current_file = file
+            # ♻️ Installed copy already matches: leave it unstaged, apply_update keeps it
+            if self._file_sha256(f"/{file}") == self.hashes[file]:
+                logger.info(f"Unchanged, skipping download: {file}")
+                self.progress = int(((i + 1) / total) * 100)
+                continue
+            await self._ensure_dirs(dest)
+            r = None
             try:
                 logger.info(f"Downloading: {file} → {url}")
-                r = requests.get(url)
-                content = r.content
-                if self._should_normalize(file):
-                    content = content.replace(b"\r\n", b"\n")
-                    logger.debug(f"Normalized line endings for {file}")
+                r = self._session().get(url)
+                if r.status_code != 200:
+                    logger.error(f"Download failed: {file}: HTTP {r.status_code}")
+                    return False
+                # Stream body → (normalize) → hash + flash; no re-read, no full copy in RAM
+                normalize = self._should_normalize(file)
+                h = hashlib.sha256()
+                carry = 0  # Trailing CR held back in case its LF is in the next chunk
                 with open(dest, "wb") as f:
-                    f.write(content)
-                actual_hash = self._sha256(dest)
+                    while True:
+                        n = r.readinto(body[carry])
+                        if not n:
+                            break
+                        if normalize:
+                            # Receive behind the carried CR and strip CRLF in place
+                            if carry:
+                                buf[0] = 0x0D
+                            n = _strip_crlf(buf, n + carry)
+                            carry = 1 if buf[n - 1] == 0x0D else 0
+                            n -= carry
+                        h.update(mv[:n])
+                        f.write(mv[:n])
+                    if carry:
+                        h.update(b"\r")
+                        f.write(b"\r")
+                if normalize:
+                    logger.debug(f"Normalized line endings for {file}")
+                actual_hash = binascii.hexlify(h.digest()).decode()
                 expected_hash = self.hashes[file]
                 if actual_hash != expected_hash:
                     logger.error(f"Hash mismatch: {file}")
@@ -174,10 +490,15 @@ class OTAUpdater:
             except Exception as e:
                 logger.error(f"Download failed: {file}: {e}")
                 return False
+            finally:
+                # Drop a half-read body's socket and release the response now, not at next GC
+                if r:
+                    r.close()
+                    del r
 
         try:
-            with open(f"{self.ota_dir}/manifest.json", "w") as f:
-                json.dump(self.manifest, f)
+            with open(f"{self.ota_dir}/manifest.json", "wb") as f:
+                f.write(self._manifest_raw)  # Raw bytes: no re-serialization
             logger.debug("Saved manifest.json to OTA directory")
         except Exception as e:
             logger.error(f"Failed to save manifest.json: {e}")
@@ -187,39 +508,45 @@ class OTAUpdater:
     
     #--------------------------------------------------------------------------#
     async def apply_update(self):
+        self._dirs_created = set()
         try:
-            with open(f"{self.ota_dir}/manifest.json") as f:
-                self.manifest = json.load(f)
-            self.remote_version = self.manifest.get("version", "")
-            files_meta = self.manifest.get("files", {})
-            self.hashes = {k: v["sha256"] for k, v in files_meta.items()}
-            self.sizes = {k: v["size"] for k, v in files_meta.items()}
-            self.files = list(self.hashes.keys())
-            if not self.remote_version:
-                logger.error(f"OTA: Manifest missing version field → {self.manifest}")
+            with open(f"{self.ota_dir}/manifest.json", "rb") as f:
+                raw = f.read()
+            if not self._load_manifest(json.loads(raw)):
                 return False
+            self._manifest_raw = raw
         except Exception as e:
             logger.error(f"OTA: Failed to load manifest during apply: {e}")
             return False
 
-        try:
-            os.mkdir(self.backup_dir)
-            logger.info(f"Created backup directory: {self.backup_dir}")
-        except:
-            logger.debug(f"Backup directory already exists: {self.backup_dir}")
+        if path_exists(self.backup_dir):
+            # Only this apply's backups may remain: rollback restores whatever is here
+            self._rmtree(self.backup_dir)
+            logger.debug(f"Cleared previous backups: {self.backup_dir}")
+        else:
+            try:
+                os.mkdir(self.backup_dir)
+                logger.info(f"Created backup directory: {self.backup_dir}")
+            except OSError as e:
+                logger.error(f"Could not create backup directory: {e}")
+                return False
 
+        excluded = _USER_EXCLUDED
         for f in self.files:
-            if f in self.user_excluded:
+            if f in excluded:
                 logger.info(f"⚠️ Skipping OTA apply for user-preserved file: {f}")
                 continue
             src = f"/{f}"
             bkp = f"{self.backup_dir}/{f}"
             new = f"{self.ota_dir}/{f}"
+            if not path_exists(new):
+                # Not staged: download found the installed copy already up to date
+                logger.debug(f"Unchanged, kept in place: {f}")
+                continue
             await self._ensure_dirs(bkp)
             try:
                 os.stat(src)
-                with open(src, "rb") as r, open(bkp, "wb") as w:
-                    w.write(r.read())
+                self._copy_file(src, bkp)
                 logger.debug(f"Backed up: {f}")
             except OSError:
                 logger.warn(f"Source file missing, skipping backup: {src}")
@@ -227,8 +554,7 @@ class OTAUpdater:
                 logger.warn(f"Could not backup {f}: {e}")
             try:
                 await self._ensure_dirs(src)
-                with open(new, "rb") as r, open(src, "wb") as w:
-                    w.write(r.read())
+                self._copy_file(new, src)
                 logger.info(f"Applied: {f}")
             except Exception as e:
                 logger.error(f"Failed to apply {f}: {e}")
@@ -243,18 +569,12 @@ class OTAUpdater:
             logger.warn(f"Failed to write version file: {e}")
 
         try:
-            with open(f"{self.ota_dir}/manifest.json") as src:
-                manifest_data = json.load(src)
-            with open("/manifest.json", "w") as dst:
-                dst.write(json.dumps(manifest_data))
-            logger.info("📄 manifest.json copied and formatted at root")
-            with open("/version.txt") as f:
-                version_txt = f.read().strip()
-            manifest_version = manifest_data.get("version", "")
-            if manifest_version != version_txt:
-                logger.warn(f"⚠️ Version mismatch: manifest={manifest_version}, version.txt={version_txt}")
+            # Same bytes the server sent, kept from the OTA copy read above
+            with open("/manifest.json", "wb") as dst:
+                dst.write(self._manifest_raw)
+            logger.info("📄 manifest.json copied to root")
         except Exception as e:
-            logger.warn(f"Could not write or verify manifest.json: {e}")
+            logger.warn(f"Could not write manifest.json: {e}")
 
         await self.cleanup()
 
@@ -268,21 +588,23 @@ class OTAUpdater:
     
     #--------------------------------------------------------------------------#
     async def rollback(self):
+        excluded = _USER_EXCLUDED
         for f in self.files:
-            if f in self.user_excluded:
+            if f in excluded:
                 logger.info(f"⚠️ Skipping rollback for user-preserved file: {f}")
                 continue
             bkp = f"{self.backup_dir}/{f}"
             dst = f"/{f}"
+            if not path_exists(bkp):
+                continue  # Not replaced by this apply (unchanged, or new in this update)
             try:
-                with open(bkp, "rb") as r, open(dst, "wb") as w:
-                    w.write(r.read())
+                self._copy_file(bkp, dst)
                 logger.info(f"Rollback: {f}")
             except Exception as e:
                 logger.error(f"Rollback failed: {f}: {e}")
 
         try:
-            if "ota_pending.flag" in os.listdir("/"):
+            if path_exists("ota_pending.flag"):
                 os.remove("ota_pending.flag")
                 logger.info("🗑 ota_pending.flag removed after rollback")
         except Exception as e:
@@ -292,18 +614,31 @@ class OTAUpdater:
     
     #--------------------------------------------------------------------------#
     def _rmtree(self, path):
-        for item in os.listdir(path):
-            full_path = f"{path}/{item}"
-            try:
-                mode = os.stat(full_path)[0]
-                if mode & 0x4000:
-                    self._rmtree(full_path)
-                    os.rmdir(full_path)
+        # Iterative walk; ilistdir already gives the entry type, so no per-entry stat.
+        # Removal waits until the walk is done so no directory changes mid-iteration.
+        stack = [path]
+        files = []
+        dirs = []
+        while stack:
+            parent = stack.pop()
+            for entry in os.ilistdir(parent):
+                full_path = f"{parent}/{entry[0]}"
+                if entry[1] == 0x4000:
+                    stack.append(full_path)
+                    dirs.append(full_path)
                 else:
-                    os.remove(full_path)
+                    files.append(full_path)
+        for f in files:
+            try:
+                os.remove(f)
+            except Exception as e:
+                logger.warn(f"Could not remove {f}: {e}")
+        for d in reversed(dirs):  # Children were appended after their parents
+            try:
+                os.rmdir(d)
             except Exception as e:
-                logger.warn(f"Could not remove {full_path}: {e}")
-                
+                logger.warn(f"Could not remove {d}: {e}")
+
     #--------------------------------------------------------------------------#
     async def cleanup(self):
         try:
@@ -319,10 +654,11 @@ class OTAUpdater:
     
     #--------------------------------------------------------------------------#    
     def cleanup_flags(self):
-        for flag in ["ota_pending.flag", "ota_commit_pending.flag"]:
+        for flag in ("ota_pending.flag", "ota_commit_pending.flag"):
+            # Just try the remove: one syscall, absent flag is not an error
             try:
-                if flag in os.listdir("/"):
-                    os.remove(flag)
-                    logger.info(f"🗑 {flag} removed")
-            except Exception as e:
-                logger.warn(f"Failed to remove {flag}: {e}")
+                os.remove(flag)
+                logger.info(f"🗑 {flag} removed")
+            except OSError as e:
+                if e.args[0] != 2:  # ENOENT
+                    logger.warn(f"Failed to remove {flag}: {e}")
@@ -1,7 +1,7 @@
 # 📁 ota_manager.py
 import machine, os, gc, asyncio
 import logger
-from ota import OTAUpdater
+from ota import OTAUpdater, path_exists
 from scaled_ui.oled_ui import OLED_UI
 
 REPO_URL = "https://raw.githubusercontent.com/liftronix/eleECG/refs/heads/main"
@@ -36,7 +36,7 @@ async def show_progress(ota, led_blinker, display):
     
 #---------------------------------------
 async def apply_ota_if_pending(led_blinker):
-    if "ota_pending.flag" not in os.listdir("/"):
+    if not path_exists("ota_pending.flag"):
         return
     logger.info("🟡 ota_pending.flag detected — applying OTA update")
     ota = OTAUpdater(REPO_URL)
@@ -54,7 +54,7 @@ async def apply_ota_if_pending(led_blinker):
 async def verify_ota_commit(online_lock, ota_lock, display):
     updater = OTAUpdater(REPO_URL)
 
-    if "ota_commit_pending.flag" not in os.listdir("/"):
+    if not path_exists("ota_commit_pending.flag"):
         return  # No verification needed
 
     logger.info("🔎 Verifying OTA commit...")
@@ -68,14 +68,14 @@ async def verify_ota_commit(online_lock, ota_lock, display):
             logger.info(f"Attempt {attempts+1}/{max_attempts} — OTA commit check")
             display.show_message(f"Verify\nTry {attempts+1}")
 
-            # Wait for internet lock — if fails, retry
+            # Wait for internet lock — wakes the moment WiFi is up; the timeout
+            # alone paces offline retries (same 10 s per attempt as before)
             try:
-                await asyncio.wait_for(online_lock.wait(), timeout=5)
+                await asyncio.wait_for(online_lock.wait(), timeout=10)
             except asyncio.TimeoutError:
                 logger.warn("🕸️ Internet not ready — will retry")
                 display.show_message("Verify\nNo WiFi")
                 attempts += 1
-                await asyncio.sleep(5)
                 continue  # retry loop
 
             # Try OTA version comparison
@@ -115,6 +115,7 @@ async def verify_ota_commit(online_lock, ota_lock, display):
         display.show_message("Verify\nException")
 
     finally:
+        updater.close()
         ota_lock.set()  # ✅ Resume Sensing tasks
 
         
@@ -162,4 +163,5 @@ async def check_and_download_ota(led_blinker, ota_lock, display, online_lock):
         except asyncio.TimeoutError:
             logger.warn("⏳ Online check timed out — skipping OTA this round")            
         
+        updater.close()  # Don't hold a TLS connection open between checks
         await asyncio.sleep(300)
@@ -1,6 +1,7 @@
 # platform_boot.py
 
 import machine, time, logger
+import uasyncio as asyncio
 from machine import Pin, I2C, Timer
 import ssd1306
 
@@ -10,6 +11,8 @@ offline_time_s = 0
 watch_dog_time_s = 0
 
 sys_timer = None
+_reset_threshold = 120
+_wdt_warn = asyncio.ThreadSafeFlag()  # Set by tick; logged by wdt_warn_logger()
 
 # --- Power Pin ---
 def init_power_pin(pin_num=2):
@@ -33,15 +36,20 @@ def init_display(scl=5, sda=4):
 def init_sys_timer(online_lock, reset_threshold=120):
     """Starts a periodic system timer for uptime and WDT logic"""
     
+    global _reset_threshold
+    _reset_threshold = reset_threshold
+
     def tick(timer):
+        # Per-tick work is integer counters only; wdt_warn_logger() formats the countdown
         global uptime_s, offline_time_s, watch_dog_time_s
 
         uptime_s += 1
         watch_dog_time_s += 1
 
         if watch_dog_time_s > (reset_threshold - 10):
-            logger.warn(f"Impending WatchDog Reset {reset_threshold - watch_dog_time_s}")
+            _wdt_warn.set()
         if watch_dog_time_s > reset_threshold:
+            # Stays here, not in the logger task: a stalled event loop is what this catches
             logger.warn("Trigger WatchDog Reset")
             with open("/reset_timestamp.txt", "w") as f:
                 reset_time_stamp = str(int(time.time()))  # Save as raw epoch int
@@ -58,6 +66,12 @@ def init_sys_timer(online_lock, reset_threshold=120):
     sys_timer.init(mode=Timer.PERIODIC, period=1000, callback=tick)
     return sys_timer
 
+async def wdt_warn_logger():
+    """Logs the watchdog countdown signalled by the system timer"""
+    while True:
+        await _wdt_warn.wait()
+        logger.warn(f"Impending WatchDog Reset {_reset_threshold - watch_dog_time_s}")
+
 # --- Accessors ---
 def get_uptime():
     return uptime_s
@@ -14,9 +14,15 @@ class ButtonHandler:
 
         self.ui = None
 
-        # debounce tracking
-        self.left_ready = True
-        self.right_ready = True
+        # debounce tracking: ticks of the last accepted release per side
+        self.debounce_ms = 300
+        self.left_released_at = time.ticks_add(time.ticks_ms(), -self.debounce_ms)
+        self.right_released_at = self.left_released_at
+
+        # IRQs only record the press and wake one consumer task
+        self._left_duration = -1   # Pending press duration (ms); -1 → none
+        self._right_duration = -1
+        self._flag = asyncio.ThreadSafeFlag()
 
     def attach_ui(self, ui):
         self.ui = ui
@@ -24,30 +30,40 @@ class ButtonHandler:
     def start(self):
         self.left.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._handle_left)
         self.right.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING, handler=self._handle_right)
+        asyncio.create_task(self._run())
 
     def _handle_left(self, pin):
         now = time.ticks_ms()
         if pin.value() == 0:  # button pressed
             self.left_pressed_at = now
         else:  # button released
-            if not self.left_ready:
+            if time.ticks_diff(now, self.left_released_at) < self.debounce_ms:
                 return
-            self.left_ready = False
-            duration = time.ticks_diff(now, self.left_pressed_at)
-            asyncio.create_task(self._process_event("left", duration))
-            asyncio.create_task(self._debounce("left"))
+            self.left_released_at = now
+            self._left_duration = time.ticks_diff(now, self.left_pressed_at)
+            self._flag.set()
 
     def _handle_right(self, pin):
         now = time.ticks_ms()
         if pin.value() == 0:
             self.right_pressed_at = now
         else:
-            if not self.right_ready:
+            if time.ticks_diff(now, self.right_released_at) < self.debounce_ms:
                 return
-            self.right_ready = False
-            duration = time.ticks_diff(now, self.right_pressed_at)
-            asyncio.create_task(self._process_event("right", duration))
-            asyncio.create_task(self._debounce("right"))
+            self.right_released_at = now
+            self._right_duration = time.ticks_diff(now, self.right_pressed_at)
+            self._flag.set()
+
+    async def _run(self):
+        # Single consumer: sleeps until an edge IRQ reports a release
+        while True:
+            await self._flag.wait()
+            duration, self._left_duration = self._left_duration, -1
+            if duration >= 0:
+                await self._process_event("left", duration)
+            duration, self._right_duration = self._right_duration, -1
+            if duration >= 0:
+                await self._process_event("right", duration)
 
     async def _process_event(self, side, duration):
         logger.debug(f"ButtonHandler → {side} press duration: {duration}ms")
@@ -71,13 +87,7 @@ class ButtonHandler:
             else:
                 await self.ui.next()
 
-    async def _debounce(self, side):
-        await asyncio.sleep_ms(300)
-        if side == "left":
-            self.left_ready = True
-        else:
-            self.right_ready = True
-                    
+
 if __name__ == "__main__":
     from scaled_ui.oled_ui import OLED_UI
     from scaled_ui.button_handler import ButtonHandler
@@ -1,12 +1,48 @@
+import micropython
+from array import array
 from scaled_ui.font_map import get_char_bitmap
 
-def draw_char(oled, char, x, y, scale=2):
-    bmp = get_char_bitmap(char)
+_blit_args = array('i', [0, 0, 0, 0, 0])  # x, y, scale, width, height (viper takes ≤ 4 args)
+
+@micropython.viper
+def _blit_char(buf: ptr8, glyph: ptr8, args: ptr32):
+    # Set scaled glyph pixels straight into a MONO_VLSB framebuffer, clipped to it
+    x = args[0]
+    y = args[1]
+    scale = args[2]
+    width = args[3]
+    height = args[4]
     for row in range(8):
-        line = bmp[row]
+        line = glyph[row]
+        if not line:
+            continue
         for col in range(8):
             if (line >> (7 - col)) & 1:
-                oled.fill_rect(x + col*scale, y + row*scale, scale, scale, 1)
+                px0 = x + col * scale
+                py = y + row * scale
+                for dy in range(scale):
+                    if uint(py) < uint(height):
+                        off = (py >> 3) * width
+                        mask = 1 << (py & 7)
+                        px = px0
+                        for dx in range(scale):
+                            if uint(px) < uint(width):
+                                buf[off + px] |= mask
+                            px += 1
+                    py += 1
+
+def _set_geometry(oled, scale):
+    a = _blit_args
+    a[2] = scale
+    a[3] = oled.width
+    a[4] = oled.height
+
+def draw_char(oled, char, x, y, scale=2):
+    _set_geometry(oled, scale)
+    a = _blit_args
+    a[0] = x
+    a[1] = y
+    _blit_char(oled.buffer, get_char_bitmap(char), a)
 
 def draw_text(oled, text, x=0, y=0, scale=2):
     max_cols = oled.width // (8 * scale)
@@ -15,13 +51,20 @@ def draw_text(oled, text, x=0, y=0, scale=2):
 
     oled.fill(0)
 
+    # Geometry is fixed for the whole string; per glyph only x/y change
+    _set_geometry(oled, scale)
+    a = _blit_args
+    buf = oled.buffer
+    blit, glyph = _blit_char, get_char_bitmap  # Locals: no global lookups per char
     lines = text.split('\n')  # explicit newlines first
     for row, line in enumerate(lines):
         if row >= max_rows:
             break
+        a[1] = y + row * line_height
         for col, char in enumerate(line):
             if col >= max_cols:
                 break
-            draw_char(oled, char, x + col * 8 * scale, y + row * line_height, scale)
+            a[0] = x + col * 8 * scale
+            blit(buf, glyph(char), a)
 
-    oled.show()
\ No newline at end of file
+    oled.show()
@@ -1,3 +1,4 @@
+import micropython
 import logger
 from scaled_ui.font_renderer import draw_text
 
@@ -8,6 +9,7 @@ class OLED_UI:
         self.index = 0
         self.scale = scale
 
+    @micropython.native
     async def next(self):
         sensor_count = len(self.sensors)
         if sensor_count == 0:
@@ -18,6 +20,7 @@ class OLED_UI:
         logger.debug(f"UI → next(): Moving to sensor index {self.index}")
         await self._render_current()
 
+    @micropython.native
     async def previous(self):
         sensor_count = len(self.sensors)
         if sensor_count == 0:
@@ -28,14 +31,17 @@ class OLED_UI:
         logger.debug(f"UI → previous(): Moving to sensor index {self.index}")
         await self._render_current()
 
+    @micropython.native
     async def combo_action(self):
         logger.debug("UI → combo_action(): Activating special mode")
         draw_text(self.oled, "Special Mode Active", scale=self.scale)
 
+    @micropython.native
     def show_message(self, msg, scale=None):
         logger.debug(f"UI → show_message(): {msg}")
         draw_text(self.oled, msg, scale or self.scale)
 
+    @micropython.native
     async def _render_current(self):
         if not self.sensors or len(self.sensors) == 0:
             logger.debug("UI → _render_current(): No sensor functions available")
@@ -83,6 +83,8 @@ class SDCardManager:
 
     def write_file(self, filename, data, append=True, safe=False):
         mode = "a" if append else "w"
+        if not isinstance(data, str):
+            mode += "b"  # bytes / bytearray / memoryview
         path = self._full_path(filename)
         try:
             if safe:
@@ -94,9 +96,12 @@ class SDCardManager:
             else:
                 with open(path, mode) as f:
                     f.write(data)
-                Logger.info("Wrote: {}".format(path))
+                if Logger.DEBUG_MODE:  # Per-write line would cost a flash log append each batch
+                    Logger.debug("Wrote: {}".format(path))
+            return True
         except Exception as e:
             Logger.error("Write failed for {}: {}".format(filename, e))
+            return False
 
     def is_dir(self, path):
         try:
@@ -4,6 +4,7 @@ _sensor_data = {}          # {'mic': {payload}, 'mpu': {payload}, ...}
 _sensor_seq = {}           # {'mic': 101, 'mpu': 56, ...}
 _lock = _thread.allocate_lock()
 
+# Payloads are copied on publish, so callers may reuse and mutate their dicts
 def push_sensor_data(data: dict):
     global _sensor_data, _sensor_seq
     sensor = data.get('sensor')
@@ -14,11 +15,26 @@ def push_sensor_data(data: dict):
         _sensor_seq[sensor] = _sensor_seq.get(sensor, 0) + 1
         _sensor_data[sensor] = data.copy()
 
-def get_sensor_snapshot():
+def push_sensor_data_batch(items):
+    # Publish several sensor payloads under a single lock acquisition
     with _lock:
-        # Compose full snapshot
-        snapshot = {
-            'seq': _sensor_seq.copy(),
-            'payload': _sensor_data.copy()
-        }
-        return snapshot
\ No newline at end of file
+        for data in items:
+            sensor = data.get('sensor')
+            if not sensor:
+                continue  # Ignore if no sensor tag
+            _sensor_seq[sensor] = _sensor_seq.get(sensor, 0) + 1
+            _sensor_data[sensor] = data.copy()
+
+def get_sensor_snapshot(out=None):
+    # Payloads are never mutated after publish, so snapshots hold references.
+    # Passing the previous snapshot back in refreshes it in place: once every
+    # sensor has reported, no new dicts are built per call.
+    with _lock:
+        if out is None:
+            return {
+                'seq': _sensor_seq.copy(),
+                'payload': _sensor_data.copy()
+            }
+        out['seq'].update(_sensor_seq)
+        out['payload'].update(_sensor_data)
+        return out
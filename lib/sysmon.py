@@ -3,25 +3,43 @@
 import uos
 import gc
 import asyncio
+import micropython
+from array import array
 
 # --- Configuration ---
-BASELINE_IDLE_TICKS = 16683  # Measured 100% idle reference, Pico2W
 MONITOR_INTERVAL = 5         # Seconds between samples
-#BASELINE_IDLE_TICKS = 8970   # Your measured 100% idle reference, PicoW
+CALIBRATION_MS = 1000        # Boot-time idle measurement window
 
 # --- Internal State ---
-_idle_counter = 0
+_idle = array('l', [0])      # Idle tick counter (array slot: no global rebinding)
+_baseline = array('l', [0])  # 100% idle ticks per MONITOR_INTERVAL, measured at boot
 
 # --- Idle Task ---
+@micropython.native
 async def idle_task():
-    global _idle_counter
+    c = _idle
     while True:
-        _idle_counter += 1
+        c[0] += 1
         await asyncio.sleep_ms(0)
 
+# --- Idle Baseline ---
+async def calibrate_baseline():
+    """Measure the idle rate on this board and emitter; run with idle_task
+    started and before the other tasks, so the count is close to 100% idle"""
+    snapshot = _idle[0]
+    await asyncio.sleep_ms(CALIBRATION_MS)
+    ticks = _idle[0] - snapshot
+    _baseline[0] = ticks * MONITOR_INTERVAL * 1000 // CALIBRATION_MS
+    print(f"📏 Idle baseline: {_baseline[0]} ticks / {MONITOR_INTERVAL}s")
+
 # --- CPU Utilization ---
 def get_cpu_usage(idle_ticks: int) -> str:
-    usage = max(0.0, (1 - idle_ticks / BASELINE_IDLE_TICKS)) * 100
+    # An interval idler than the boot measurement means the baseline was low
+    if idle_ticks > _baseline[0]:
+        _baseline[0] = idle_ticks
+    if not _baseline[0]:
+        return "🔥 CPU Active: n/a"
+    usage = (1 - idle_ticks / _baseline[0]) * 100
     return f"🔥 CPU Active: {usage:.2f}%"
 
 # --- Memory Monitor ---
@@ -47,11 +65,10 @@ def flash_usage() -> str:
 
 # --- Resource Monitor Task ---
 async def monitor_resources():
-    global _idle_counter
     while True:
-        snapshot = _idle_counter
+        snapshot = _idle[0]
         await asyncio.sleep(MONITOR_INTERVAL)
-        ticks = _idle_counter - snapshot
+        ticks = _idle[0] - snapshot
         print(get_cpu_usage(ticks))
         print(memory_usage(full=True))
         print(flash_usage())
@@ -11,6 +11,7 @@ from ota_manager import (
     verify_ota_commit,
     check_and_download_ota
 )
+from ota import path_exists
 
 from uthingsboard.client import TBDeviceMqttClient
 from ledblinker import LEDBlinker
@@ -22,7 +23,7 @@ from config_loader import load_config
 
 config = load_config()
 
-if "reset_timestamp.txt" in os.listdir("/"):
+if path_exists("/reset_timestamp.txt"):
     with open("/reset_timestamp.txt", "r") as f:
         reset_time_stamp = f.read()
         logger.warn(f"Starting Timestamp: {time.localtime()}")
@@ -42,7 +43,7 @@ ota_lock.set()  # Start with sensors enabled
 
 from platform_boot import (
     init_power_pin, init_display, init_sys_timer, deinit_sys_timer,
-    get_uptime, get_offline_time, reset_watchdog_timer
+    get_uptime, get_offline_time, reset_watchdog_timer, wdt_warn_logger
 )
 
 init_power_pin()
@@ -76,7 +77,7 @@ sys_timer = init_sys_timer(online_lock)
 # 🧮 Config Sync
 def sync_config_if_changed(sd_path="/sd/config.json", flash_path="/config.json", file_name="config.json"):
     try:
-        if file_name not in os.listdir("/sd"):
+        if not path_exists(sd_path):
             logger.warn("No config.json found on SD card")
             return
 
@@ -104,13 +105,14 @@ latest_sensor_lock = asyncio.Lock()
 # 📤 Sensor Polling & Logging
 async def drain_sensor_data(datalogger, ota_lock):
     last_seq = {}
+    snapshot = None  # Refreshed in place by get_sensor_snapshot()
     while True:
         await ota_lock.wait()  # ⛔ Block if OTA is active
-        if power_state['low_power_mode']:
+        if power_state.low_power_mode:
             logger.warn("💤 Low Power Mode — Sensors Paused")
             await asyncio.sleep(5)  # Pause during low power
             continue
-        snapshot = get_sensor_snapshot()
+        snapshot = get_sensor_snapshot(snapshot)
         if not snapshot or "payload" not in snapshot or "seq" not in snapshot:
             await asyncio.sleep_ms(100)
             continue
@@ -135,14 +137,14 @@ async def drain_sensor_data(datalogger, ota_lock):
 
                 entry = f"[{sensor}] Seq={current_seq} → {data}"
                 logger.debug(entry)
-                await datalogger.log(entry)
+                datalogger.log(entry)
         await asyncio.sleep_ms(1000)
 
 # 🔦Laser Polling
 async def drain_laser_data(laser, snapshot_ref, datalogger, ota_lock):
     while True:
         await ota_lock.wait()  # ⛔ Block if OTA is active
-        if power_state['low_power_mode']:
+        if power_state.low_power_mode:
             logger.warn("💤 Low Power Mode — Laser Paused")
             await asyncio.sleep(5)  # Pause during low power
             continue
@@ -167,7 +169,7 @@ async def drain_laser_data(laser, snapshot_ref, datalogger, ota_lock):
                 }
 
             entry = f"[laser] Seq={seq} → {value} mm"
-            await datalogger.log(entry)
+            datalogger.log(entry)
 
         except Exception as e:
             logger.warn(f"Laser: Polling error — {e}")
@@ -187,7 +189,7 @@ async def send_to_thingsboard(client, ota_lock, online_lock, ui):
         try:
             await asyncio.wait_for(online_lock.wait(), timeout=20)
             await ota_lock.wait()  # ⛔ Block if OTA is active
-            if power_state['low_power_mode']:
+            if power_state.low_power_mode:
                 logger.warn("💤 Low Power Mode — skipping telemetry this round")
                 await asyncio.sleep(5)  # Pause during low power
                 continue
@@ -281,7 +283,7 @@ async def auto_refresh_ui(ui, ota_lock, online_lock, interval=2):
     global mqtt_seq_counter
     while True:
         await ota_lock.wait()  # ⛔ Block if OTA is active
-        if power_state['low_power_mode']:
+        if power_state.low_power_mode:
             ui.show_message(f"  LOW\n POWER")
             await asyncio.sleep(5)  # Pause during low power
             continue
@@ -299,7 +301,9 @@ async def main():
     logger.info(f"🧾 Running firmware version: {get_local_version()}")
     
     asyncio.create_task(sysmon.idle_task())          # Track idle time
+    await sysmon.calibrate_baseline()                # 100% idle reference, before other tasks
     asyncio.create_task(sysmon.monitor_resources())  # Start diagnostics
+    asyncio.create_task(wdt_warn_logger())           # WDT countdown from sys_timer
     
     # 🔆 LED Setup
     led_blinker = LEDBlinker(pin_num='LED', interval_ms=500)